@@ -3,6 +3,7 @@ Cost tracking and optimization API endpoints.
 Provides cost analytics, forecasting, and optimization recommendations.
 """
 
+import uuid
 from datetime import date, datetime
 from typing import List, Optional
 
@@ -19,10 +20,10 @@ router = APIRouter()
 class CostRecordResponse(BaseModel):
     """Response schema for cost records."""
 
-    id: int
+    id: uuid.UUID
     cloud_provider: str
     service: str
-    region: str
+    region: Optional[str] = None
     amount: float
     currency: str
     recorded_date: date
@@ -0,0 +1,35 @@
+"""
+CloudOps Central Request Clock
+
+This module provides a per-request "now" so that expiry and suppression checks
+evaluated many times while handling one request share a single clock reading.
+"""
+
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+_request_now: ContextVar[Optional[datetime]] = ContextVar("request_now", default=None)
+
+
+def request_now() -> datetime:
+    """
+    Get the current UTC time for the request being handled.
+
+    Outside of a request (background jobs, scripts) this falls back to reading
+    the clock on every call.
+
+    Returns:
+        Naive UTC datetime, as returned by ``datetime.utcnow()``
+    """
+    now = _request_now.get()
+    if now is None:
+        return datetime.utcnow()
+    return now
+
+
+async def pin_request_now() -> datetime:
+    """FastAPI dependency that reads the clock once for the current request."""
+    now = datetime.utcnow()
+    _request_now.set(now)
+    return now
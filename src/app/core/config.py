@@ -7,12 +7,23 @@ It uses Pydantic settings for type validation and environment variable managemen
 
 import os
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings
 
 
+@lru_cache(maxsize=16)
+def _split_comma_separated(value: str) -> Tuple[str, ...]:
+    """
+    Split a comma-separated setting into stripped items.
+
+    Settings are rebuilt from the same environment strings many times, so the
+    parsed result is cached; a tuple is returned so callers cannot mutate it.
+    """
+    return tuple(item.strip() for item in value.split(","))
+
+
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
 
@@ -136,7 +147,7 @@ class Settings(BaseSettings):
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
         """Parse CORS origins from environment variable."""
         if isinstance(v, str) and not v.startswith("["):
-            return [i.strip() for i in v.split(",")]
+            return list(_split_comma_separated(v))
         elif isinstance(v, (list, str)):
             return v
         raise ValueError(v)
@@ -145,7 +156,7 @@ class Settings(BaseSettings):
     def assemble_allowed_hosts(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
         """Parse allowed hosts from environment variable."""
         if isinstance(v, str) and not v.startswith("["):
-            return [i.strip() for i in v.split(",")]
+            return list(_split_comma_separated(v))
         elif isinstance(v, (list, str)):
             return v
         raise ValueError(v)
@@ -154,7 +165,7 @@ class Settings(BaseSettings):
     def assemble_celery_accept_content(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
         """Parse Celery accept content from environment variable."""
         if isinstance(v, str) and not v.startswith("["):
-            return [i.strip() for i in v.split(",")]
+            return list(_split_comma_separated(v))
         elif isinstance(v, (list, str)):
             return v
         raise ValueError(v)
@@ -6,13 +6,14 @@ utilities for database operations using SQLAlchemy with async support.
 """
 
 import asyncio
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, AsyncIterator, Optional, Sequence
 
-from sqlalchemy import event, pool
+from sqlalchemy import Select, event, pool
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
 from app.core.logging import get_logger
 
@@ -27,6 +28,9 @@ engine = create_async_engine(
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_pre_ping=True,
     pool_recycle=3600,  # 1 hour
+    # Batch executemany INSERTs into multi-row VALUES statements
+    use_insertmanyvalues=True,
+    insertmanyvalues_page_size=1000,
 )
 
 # Create async session factory
@@ -134,6 +138,44 @@ def transaction(session: AsyncSession) -> DatabaseTransaction:
     return DatabaseTransaction(session)
 
 
+# Upper bound on rows buffered per round trip when paginating
+PAGINATE_MAX_BATCH_SIZE = 1000
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    batch_size: int = PAGINATE_MAX_BATCH_SIZE,
+) -> AsyncIterator[Sequence[Any]]:
+    """
+    Stream a page of ORM entities in batches through a server-side cursor.
+
+    Memory use is bounded by the batch size rather than the page or result
+    size, so list endpoints and background jobs can share one query path.
+
+    Args:
+        session: Database session
+        stmt: Select of a single entity, already filtered and ordered
+        skip: Number of rows to skip
+        limit: Maximum number of rows to return, or None for all rows
+        batch_size: Maximum number of rows per yielded batch
+
+    Yields:
+        Sequences of entities
+    """
+    if skip:
+        stmt = stmt.offset(skip)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+        batch_size = max(1, min(limit, batch_size))
+
+    result = await session.stream_scalars(stmt.execution_options(yield_per=batch_size))
+    async for batch in result.partitions():
+        yield batch
+
+
 class Repository:
     """Base repository class for database operations."""
 
@@ -239,13 +281,34 @@ class ConnectionPoolMonitor:
 
 
 # Health check utilities
+
+# Probes arriving within this window (load balancers, /health polling) reuse the
+# last healthy result instead of opening a new session for every request.
+HEALTH_CHECK_TTL_SECONDS = 1.0
+
+_health_check_cache = TTLCache(maxsize=1, ttl=HEALTH_CHECK_TTL_SECONDS)
+
+
+def clear_health_check_cache() -> None:
+    """Forget the cached health check result, so the next check probes the database."""
+    _health_check_cache.clear()
+
+
 async def database_health_check() -> dict:
     """
     Comprehensive database health check.
 
+    Healthy results are cached for ``HEALTH_CHECK_TTL_SECONDS``; a cached result
+    is marked with ``"cached": True``. Failures are never cached, so a recovered
+    database is reported healthy on the next check.
+
     Returns:
         dict: Health check results
     """
+    cached = _health_check_cache.get("database")
+    if cached is not None:
+        return {**cached, "cached": True}
+
     try:
         # Basic connectivity test
         async with AsyncSessionLocal() as session:
@@ -255,7 +318,7 @@ async def database_health_check() -> dict:
         # Pool status
         pool_status = ConnectionPoolMonitor.get_pool_status()
 
-        return {
+        health = {
             "status": "healthy",
             "database_version": version,
             "pool_status": pool_status,
@@ -263,8 +326,12 @@ async def database_health_check() -> dict:
         }
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
-        return {
+        health = {
             "status": "unhealthy",
             "error": str(e),
             "pool_status": ConnectionPoolMonitor.get_pool_status(),
         }
+
+    if health["status"] == "healthy":
+        _health_check_cache.set("database", health)
+    return health
@@ -5,19 +5,109 @@ This module contains base model classes and common mixins used throughout
 the application for consistent database schema patterns.
 """
 
+import enum
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Type
 
-from sqlalchemy import DateTime, String, Text, func
+from sqlalchemy import DateTime, Enum, SmallInteger, String, Text, event, func, literal
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.types import TypeDecorator
 
 # Create the declarative base
 Base = declarative_base()
 
 
+def _enum_values(enum_cls: Type[enum.Enum]) -> List[str]:
+    """Return the persisted values of an enum's members."""
+    return [member.value for member in enum_cls]
+
+
+def pg_enum(enum_cls: Type[enum.Enum]) -> Enum:
+    """
+    Build a named native PostgreSQL enum type for a Python enum.
+
+    The database stores the members' values (e.g. ``"active"``) rather than
+    their names, so the driver passes plain strings and raw SQL can use them.
+
+    Args:
+        enum_cls: Python enum class to map
+
+    Returns:
+        SQLAlchemy Enum type
+    """
+    return Enum(
+        enum_cls,
+        name=enum_cls.__name__.lower(),
+        values_callable=_enum_values,
+        native_enum=True,
+    )
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a Python enum as a SMALLINT holding the member's declaration index.
+
+    Rows are narrower than with a text enum type, and ordered enums such as
+    severities compare numerically in SQL. New members must only be appended,
+    because reordering members changes their stored values.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: Type[enum.Enum]):
+        super().__init__()
+        self.enum_cls = enum_cls
+        self._members = tuple(enum_cls)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def ordinal(self, value: Any) -> int:
+        """Get the stored SMALLINT code of an enum member or its value."""
+        return self._codes[self.enum_cls(value)]
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[int]:
+        if value is None:
+            return None
+        return self.ordinal(value)
+
+    def process_result_value(self, value: Optional[int], dialect: Any) -> Optional[enum.Enum]:
+        if value is None:
+            return None
+        return self._members[value]
+
+
+def sql_now(now: Optional[datetime] = None) -> ColumnElement:
+    """Get a SQL expression for the given time, or the database's ``now()``."""
+    if now is None:
+        return func.now()
+    return literal(now, DateTime(timezone=True))
+
+
+def reset_cached_on_change(cls: type, attributes: tuple, cached: tuple) -> None:
+    """
+    Drop memoized properties when any of the attributes they derive from change.
+
+    Args:
+        cls: Mapped class owning the memoized properties
+        attributes: Column or relationship attributes the properties read
+        cached: Names of the ``cached_property`` attributes to reset
+    """
+
+    def reset(target: Any, *args: Any) -> None:
+        for name in cached:
+            target.__dict__.pop(name, None)
+
+    for attribute in attributes:
+        for identifier in ("set", "append", "remove"):
+            event.listen(getattr(cls, attribute), identifier, reset)
+    event.listen(cls, "refresh", reset)
+    event.listen(cls, "expire", reset)
+
+
 class TimestampMixin:
     """Mixin for adding timestamp fields to models."""
 
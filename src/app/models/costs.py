@@ -7,20 +7,76 @@ alerts, and optimization recommendations.
 
 import enum
 import uuid
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
-
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Numeric, String, Text
+from decimal import ROUND_HALF_EVEN, Decimal
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from sqlalchemy import (
+    CHAR,
+    REAL,
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    UniqueConstraint,
+    cast,
+    func,
+    insert,
+    text,
+    update,
+)
 from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import BaseModel, NamedModel
+from app.models.base import BaseModel, NamedModel, pg_enum, reset_cached_on_change
 
 if TYPE_CHECKING:
     from app.models.infrastructure import CloudProvider, Infrastructure, InfrastructureResource
 
 
+# Monetary amounts are stored as BIGINT millionths of the currency unit so that
+# aggregates run on integers and rows hydrate without Decimal construction.
+MICROS_PER_UNIT = 1_000_000
+
+
+def to_micros(amount: Any) -> int:
+    """Convert a monetary amount to integer micros, rounding half to even."""
+    return int((Decimal(str(amount)) * MICROS_PER_UNIT).to_integral_value(ROUND_HALF_EVEN))
+
+
+def from_micros(micros: Optional[int]) -> Optional[Decimal]:
+    """Convert integer micros back to a Decimal amount."""
+    if micros is None:
+        return None
+    return Decimal(micros) / MICROS_PER_UNIT
+
+
+def _monetary(micros_attribute: str, doc: str) -> hybrid_property:
+    """Expose a micros column as a Decimal amount in Python and a NUMERIC expression in SQL."""
+
+    def fget(self: Any) -> Optional[Decimal]:
+        return from_micros(getattr(self, micros_attribute))
+
+    def fset(self: Any, value: Any) -> None:
+        setattr(self, micros_attribute, None if value is None else to_micros(value))
+
+    def expr(cls: type) -> Any:
+        return cast(getattr(cls, micros_attribute), Numeric) / MICROS_PER_UNIT
+
+    fget.__doc__ = doc
+    return hybrid_property(fget, fset, expr=expr)
+
+
 class CostPeriod(str, enum.Enum):
     """Enumeration of cost tracking periods."""
 
@@ -59,6 +115,47 @@ class BudgetStatus(str, enum.Enum):
     INACTIVE = "inactive"
 
 
+@dataclass(slots=True, frozen=True)
+class CostRecordRow:
+    """
+    Lightweight, immutable cost record used by the bulk ingest path.
+
+    Ingest builds millions of these per billing import; unlike ORM instances
+    they carry no ``__dict__`` or instrumentation state.
+    """
+
+    cloud_provider_id: uuid.UUID
+    billing_period_start: datetime
+    billing_period_end: datetime
+    cost_amount_micros: int
+    service_name: str
+    resource_type: str
+    resource_identifier: str
+    resource_id: Optional[uuid.UUID] = None
+    infrastructure_id: Optional[uuid.UUID] = None
+    usage_quantity: Optional[Decimal] = None
+    currency: str = "USD"
+    region: Optional[str] = None
+    usage_unit: Optional[str] = None
+    billing_account_id: Optional[str] = None
+    project_id: Optional[str] = None
+    cost_details: Dict[str, Any] = field(default_factory=dict)
+
+    def as_params(self) -> Dict[str, Any]:
+        """Return the row as INSERT parameters keyed by column name."""
+        return {name: getattr(self, name) for name in _COST_RECORD_ROW_FIELDS}
+
+
+_COST_RECORD_ROW_FIELDS = tuple(f.name for f in fields(CostRecordRow))
+
+
+def _as_insert_params(
+    records: Sequence[Union[Dict[str, Any], CostRecordRow]]
+) -> List[Dict[str, Any]]:
+    """Normalize bulk ingest input to a list of parameter dictionaries."""
+    return [r.as_params() if isinstance(r, CostRecordRow) else r for r in records]
+
+
 class CostRecord(BaseModel):
     """
     Model representing cost records for infrastructure resources.
@@ -68,6 +165,8 @@ class CostRecord(BaseModel):
 
     __tablename__ = "cost_records"
 
+    # Columns are declared widest/fixed-width first (UUIDs, timestamps, numerics)
+    # and variable-length strings/JSON last to minimise per-row alignment padding.
     resource_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("infrastructure_resources.id"),
@@ -89,48 +188,44 @@ class CostRecord(BaseModel):
         doc="ID of the cloud provider",
     )
 
-    service_name: Mapped[str] = mapped_column(
-        String(200), nullable=False, doc="Name of the cloud service (EC2, S3, etc.)"
+    billing_period_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, doc="Start of the billing period"
     )
 
-    resource_type: Mapped[str] = mapped_column(
-        String(100), nullable=False, doc="Type of resource generating the cost"
+    billing_period_end: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, doc="End of the billing period"
     )
 
-    resource_identifier: Mapped[str] = mapped_column(
-        String(255), nullable=False, doc="External resource identifier"
+    cost_amount_micros: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, doc="Cost amount in millionths of the currency unit"
     )
 
-    region: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, doc="Cloud region")
-
-    cost_amount: Mapped[Decimal] = mapped_column(
-        Numeric(12, 4), nullable=False, doc="Cost amount in USD"
+    usage_quantity: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(15, 6), nullable=True, doc="Usage quantity for the period"
     )
 
     currency: Mapped[str] = mapped_column(
-        String(3), nullable=False, default="USD", doc="Currency code"
+        CHAR(3), nullable=False, default="USD", doc="ISO 4217 currency code"
     )
 
-    billing_period_start: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, doc="Start of the billing period"
+    service_name: Mapped[str] = mapped_column(
+        String(200), nullable=False, doc="Name of the cloud service (EC2, S3, etc.)"
     )
 
-    billing_period_end: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, doc="End of the billing period"
+    resource_type: Mapped[str] = mapped_column(
+        String(100), nullable=False, doc="Type of resource generating the cost"
     )
 
-    usage_quantity: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(15, 6), nullable=True, doc="Usage quantity for the period"
+    resource_identifier: Mapped[str] = mapped_column(
+        String(255), nullable=False, doc="External resource identifier"
     )
 
+    region: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, doc="Cloud region")
+
     usage_unit: Mapped[Optional[str]] = mapped_column(
         String(50), nullable=True, doc="Unit of measurement for usage"
     )
 
-    cost_details: Mapped[Dict[str, Any]] = mapped_column(
-        JSON, nullable=False, default=dict, doc="Detailed cost breakdown"
-    )
-
     billing_account_id: Mapped[Optional[str]] = mapped_column(
         String(100), nullable=True, doc="Cloud provider billing account ID"
     )
@@ -139,6 +234,10 @@ class CostRecord(BaseModel):
         String(100), nullable=True, doc="Cloud provider project/subscription ID"
     )
 
+    cost_details: Mapped[Dict[str, Any]] = mapped_column(
+        JSON, nullable=False, default=dict, doc="Detailed cost breakdown"
+    )
+
     # Relationships
     resource: Mapped[Optional["InfrastructureResource"]] = relationship("InfrastructureResource")
 
@@ -146,6 +245,76 @@ class CostRecord(BaseModel):
 
     cloud_provider: Mapped["CloudProvider"] = relationship("CloudProvider")
 
+    cost_amount = _monetary("cost_amount_micros", "Cost amount")
+
+    __table_args__ = (
+        UniqueConstraint(
+            "cloud_provider_id",
+            "resource_identifier",
+            "billing_period_start",
+            "service_name",
+            name="unique_cost_record_natural_key",
+        ),
+    )
+
+    @classmethod
+    async def bulk_insert(
+        cls, session: AsyncSession, records: Sequence[Union[Dict[str, Any], CostRecordRow]]
+    ) -> int:
+        """
+        Insert many cost records without hydrating ORM instances.
+
+        The rows are sent as a single executemany, which the engine batches
+        into multi-row INSERT ... VALUES statements.
+
+        Args:
+            session: Database session
+            records: CostRecordRow instances or column-name to value mappings;
+                amounts go in ``cost_amount_micros`` (see ``to_micros``)
+
+        Returns:
+            Number of records inserted
+        """
+        if not records:
+            return 0
+        await session.execute(insert(cls), _as_insert_params(records))
+        return len(records)
+
+    @classmethod
+    async def bulk_upsert(
+        cls, session: AsyncSession, records: Sequence[Union[Dict[str, Any], CostRecordRow]]
+    ) -> int:
+        """
+        Insert or update cost records keyed on their natural key.
+
+        Re-delivered billing rows update the existing record in place via
+        ON CONFLICT DO UPDATE, so ingest stays idempotent without a lookup
+        per row.
+
+        Args:
+            session: Database session
+            records: CostRecordRow instances or column-name to value mappings
+
+        Returns:
+            Number of records written
+        """
+        if not records:
+            return 0
+        stmt = pg_insert(cls)
+        stmt = stmt.on_conflict_do_update(
+            constraint="unique_cost_record_natural_key",
+            set_={
+                "cost_amount_micros": stmt.excluded.cost_amount_micros,
+                "usage_quantity": stmt.excluded.usage_quantity,
+                "usage_unit": stmt.excluded.usage_unit,
+                "billing_period_end": stmt.excluded.billing_period_end,
+                "cost_details": stmt.excluded.cost_details,
+                "updated_at": func.now(),
+            },
+        )
+        await session.execute(stmt, _as_insert_params(records))
+        return len(records)
+
 
 class CostBudget(NamedModel):
     """
@@ -156,40 +325,42 @@ class CostBudget(NamedModel):
 
     __tablename__ = "cost_budgets"
 
-    budget_amount: Mapped[Decimal] = mapped_column(
-        Numeric(12, 2), nullable=False, doc="Budget amount in USD"
+    budget_amount_micros: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, doc="Budget amount in millionths of the currency unit"
     )
 
     currency: Mapped[str] = mapped_column(
-        String(3), nullable=False, default="USD", doc="Currency code"
+        CHAR(3), nullable=False, default="USD", doc="ISO 4217 currency code"
     )
 
     period: Mapped[CostPeriod] = mapped_column(
-        Enum(CostPeriod),
+        pg_enum(CostPeriod),
         nullable=False,
         default=CostPeriod.MONTHLY,
         doc="Budget period",
     )
 
     budget_status: Mapped[BudgetStatus] = mapped_column(
-        Enum(BudgetStatus),
+        pg_enum(BudgetStatus),
         nullable=False,
         default=BudgetStatus.ACTIVE,
         doc="Current budget status",
     )
 
-    warning_threshold: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+    # Basis points in a full Integer: over-budget thresholds can exceed the
+    # 327.67% a SMALLINT would allow.
+    warning_threshold: Mapped[int] = mapped_column(
+        Integer,
         nullable=False,
-        default=Decimal("80.0"),
-        doc="Warning threshold percentage (0-100)",
+        default=8000,
+        doc="Warning threshold in basis points of the budget (8000 = 80%)",
     )
 
-    critical_threshold: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+    critical_threshold: Mapped[int] = mapped_column(
+        Integer,
         nullable=False,
-        default=Decimal("100.0"),
-        doc="Critical threshold percentage (0-100)",
+        default=10000,
+        doc="Critical threshold in basis points of the budget (10000 = 100%)",
     )
 
     scope_filters: Mapped[Dict[str, Any]] = mapped_column(
@@ -204,15 +375,15 @@ class CostBudget(NamedModel):
         DateTime(timezone=True), nullable=True, doc="Budget end date (null for ongoing)"
     )
 
-    current_spend: Mapped[Decimal] = mapped_column(
-        Numeric(12, 2),
+    current_spend_micros: Mapped[int] = mapped_column(
+        BigInteger,
         nullable=False,
-        default=Decimal("0.00"),
-        doc="Current spending against this budget",
+        default=0,
+        doc="Current spending against this budget, in micros",
     )
 
-    forecasted_spend: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(12, 2), nullable=True, doc="Forecasted spending for the period"
+    forecasted_spend_micros: Mapped[Optional[int]] = mapped_column(
+        BigInteger, nullable=True, doc="Forecasted spending for the period, in micros"
     )
 
     last_updated_at: Mapped[datetime] = mapped_column(
@@ -234,14 +405,18 @@ class CostBudget(NamedModel):
         "CostAlert", back_populates="budget", cascade="all, delete-orphan"
     )
 
-    @property
+    budget_amount = _monetary("budget_amount_micros", "Budget amount")
+    current_spend = _monetary("current_spend_micros", "Current spending against this budget")
+    forecasted_spend = _monetary("forecasted_spend_micros", "Forecasted spending for the period")
+
+    @cached_property
     def spend_percentage(self) -> Decimal:
         """Calculate current spend as percentage of budget."""
-        if self.budget_amount == 0:
+        if self.budget_amount_micros == 0:
             return Decimal("0")
         return (self.current_spend / self.budget_amount) * 100
 
-    @property
+    @cached_property
     def remaining_budget(self) -> Decimal:
         """Calculate remaining budget amount."""
         return max(Decimal("0"), self.budget_amount - self.current_spend)
@@ -252,11 +427,11 @@ class CostBudget(NamedModel):
 
     def is_warning_threshold_exceeded(self) -> bool:
         """Check if warning threshold is exceeded."""
-        return self.is_over_threshold(self.warning_threshold)
+        return self.is_over_threshold(Decimal(self.warning_threshold) / 100)
 
     def is_critical_threshold_exceeded(self) -> bool:
         """Check if critical threshold is exceeded."""
-        return self.is_over_threshold(self.critical_threshold)
+        return self.is_over_threshold(Decimal(self.critical_threshold) / 100)
 
 
 class CostAlert(NamedModel):
@@ -276,11 +451,11 @@ class CostAlert(NamedModel):
     )
 
     alert_type: Mapped[AlertType] = mapped_column(
-        Enum(AlertType), nullable=False, doc="Type of alert"
+        pg_enum(AlertType), nullable=False, doc="Type of alert"
     )
 
     alert_status: Mapped[AlertStatus] = mapped_column(
-        Enum(AlertStatus),
+        pg_enum(AlertStatus),
         nullable=False,
         default=AlertStatus.ACTIVE,
         doc="Current alert status",
@@ -330,12 +505,52 @@ class CostAlert(NamedModel):
     # Relationships
     budget: Mapped[Optional["CostBudget"]] = relationship("CostBudget", back_populates="alerts")
 
+    # Open alerts are a small, hot subset of an ever-growing table; index only those.
+    __table_args__ = (
+        Index(
+            "ix_cost_alerts_active",
+            "triggered_at",
+            "severity",
+            postgresql_where=text("alert_status IN ('active', 'triggered')"),
+            postgresql_include=["budget_id", "alert_type"],
+        ),
+    )
+
     def resolve(self, resolved_by: uuid.UUID) -> None:
-        """Mark alert as resolved."""
+        """Mark alert as resolved; resolved_at is stamped by the database on flush."""
         self.alert_status = AlertStatus.RESOLVED
-        self.resolved_at = datetime.utcnow()
+        self.resolved_at = func.now()
         self.resolved_by = resolved_by
 
+    @classmethod
+    async def bulk_resolve(
+        cls, session: AsyncSession, ids: Iterable[uuid.UUID], resolved_by: uuid.UUID
+    ) -> int:
+        """
+        Resolve many alerts with a single UPDATE statement.
+
+        Args:
+            session: Database session
+            ids: IDs of the alerts to resolve
+            resolved_by: ID of the user resolving the alerts
+
+        Returns:
+            Number of alerts updated
+        """
+        ids = list(ids)
+        if not ids:
+            return 0
+        result = await session.execute(
+            update(cls)
+            .where(cls.id.in_(ids))
+            .values(
+                alert_status=AlertStatus.RESOLVED,
+                resolved_at=func.now(),
+                resolved_by=resolved_by,
+            )
+        )
+        return result.rowcount
+
     def suppress(self) -> None:
         """Suppress the alert."""
         self.alert_status = AlertStatus.SUPPRESSED
@@ -376,22 +591,22 @@ class CostOptimization(NamedModel):
         doc="Optimization priority (low, medium, high, critical)",
     )
 
-    current_cost: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2), nullable=False, doc="Current monthly cost"
+    current_cost_micros: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, doc="Current monthly cost, in micros"
     )
 
-    potential_savings: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2), nullable=False, doc="Potential monthly savings"
+    potential_savings_micros: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, doc="Potential monthly savings, in micros"
     )
 
     savings_percentage: Mapped[Decimal] = mapped_column(
         Numeric(5, 2), nullable=False, doc="Savings as percentage of current cost"
     )
 
-    confidence_score: Mapped[Decimal] = mapped_column(
-        Numeric(3, 2),
+    confidence_score: Mapped[float] = mapped_column(
+        REAL,
         nullable=False,
-        default=Decimal("0.5"),
+        default=0.5,
         doc="Confidence score (0.0 to 1.0)",
     )
 
@@ -442,10 +657,10 @@ class CostOptimization(NamedModel):
         doc="ID of the user who implemented the optimization",
     )
 
-    actual_savings: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(10, 2),
+    actual_savings_micros: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
         nullable=True,
-        doc="Actual savings realized after implementation",
+        doc="Actual savings realized after implementation, in micros",
     )
 
     optimization_details: Mapped[Dict[str, Any]] = mapped_column(
@@ -455,17 +670,42 @@ class CostOptimization(NamedModel):
     # Relationships
     resource: Mapped[Optional["InfrastructureResource"]] = relationship("InfrastructureResource")
 
-    @property
+    current_cost = _monetary("current_cost_micros", "Current monthly cost")
+    potential_savings = _monetary("potential_savings_micros", "Potential monthly savings")
+    actual_savings = _monetary("actual_savings_micros", "Actual savings realized")
+
+    __table_args__ = (
+        Index(
+            "ix_cost_optimizations_open",
+            "priority",
+            "potential_savings_micros",
+            postgresql_where=text("implemented_at IS NULL"),
+        ),
+    )
+
+    @cached_property
     def is_implemented(self) -> bool:
         """Check if optimization has been implemented."""
         return self.implemented_at is not None
 
-    @property
+    @cached_property
     def annual_savings(self) -> Decimal:
         """Calculate potential annual savings."""
         return self.potential_savings * 12
 
     def implement(self, implemented_by: uuid.UUID) -> None:
-        """Mark optimization as implemented."""
-        self.implemented_at = datetime.utcnow()
+        """Mark optimization as implemented; implemented_at is stamped by the database."""
+        self.implemented_at = func.now()
         self.implemented_by = implemented_by
+
+
+reset_cached_on_change(
+    CostBudget,
+    ("budget_amount_micros", "current_spend_micros"),
+    ("spend_percentage", "remaining_budget"),
+)
+reset_cached_on_change(
+    CostOptimization,
+    ("implemented_at", "potential_savings_micros"),
+    ("is_implemented", "annual_savings"),
+)
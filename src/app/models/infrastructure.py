@@ -14,9 +14,10 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import (
     Boolean,
     Column,
+    Computed,
     DateTime,
-    Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -24,11 +25,12 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, NamedModel
+from app.models.base import Base, NamedModel, pg_enum
 
 
 class CloudProviderType(str, enum.Enum):
@@ -80,7 +82,7 @@ class CloudProvider(NamedModel):
     __tablename__ = "cloud_providers"
 
     provider_type: Mapped[CloudProviderType] = mapped_column(
-        Enum(CloudProviderType), nullable=False, doc="Type of cloud provider"
+        pg_enum(CloudProviderType), nullable=False, doc="Type of cloud provider"
     )
 
     region: Mapped[Optional[str]] = mapped_column(
@@ -133,7 +135,7 @@ class ResourceType(NamedModel):
     __tablename__ = "resource_types"
 
     provider_type: Mapped[CloudProviderType] = mapped_column(
-        Enum(CloudProviderType),
+        pg_enum(CloudProviderType),
         nullable=False,
         doc="Cloud provider this resource type belongs to",
     )
@@ -182,6 +184,7 @@ class ResourceType(NamedModel):
         "InfrastructureTemplate",
         secondary="template_resource_types",
         back_populates="resource_types",
+        lazy="selectin",
     )
 
 
@@ -213,7 +216,7 @@ class Infrastructure(NamedModel):
     )
 
     infrastructure_status: Mapped[InfrastructureStatus] = mapped_column(
-        Enum(InfrastructureStatus),
+        pg_enum(InfrastructureStatus),
         nullable=False,
         default=InfrastructureStatus.PLANNING,
         doc="Current infrastructure status",
@@ -283,6 +286,15 @@ class Infrastructure(NamedModel):
     )
 
 
+# Drift is derived in the database from the two halves of InfrastructureResource.state.
+_RESOURCE_DRIFT_SQL = "(state->'desired') IS DISTINCT FROM (state->'actual')"
+
+
+def _empty_resource_state() -> Dict[str, Any]:
+    """Build the default state document for a new resource."""
+    return {"desired": {}, "actual": {}}
+
+
 class InfrastructureResource(NamedModel):
     """
     Model representing an individual infrastructure resource.
@@ -328,25 +340,23 @@ class InfrastructureResource(NamedModel):
     )
 
     resource_status: Mapped[ResourceStatus] = mapped_column(
-        Enum(ResourceStatus),
+        pg_enum(ResourceStatus),
         nullable=False,
         default=ResourceStatus.UNKNOWN,
         doc="Current resource status",
     )
 
-    configuration: Mapped[Dict[str, Any]] = mapped_column(
-        JSON, nullable=False, default=dict, doc="Resource configuration"
-    )
-
-    desired_configuration: Mapped[Dict[str, Any]] = mapped_column(
-        JSON, nullable=False, default=dict, doc="Desired resource configuration"
+    state: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=_empty_resource_state,
+        doc="Desired and actual configuration as {'desired': ..., 'actual': ...}",
     )
 
-    actual_configuration: Mapped[Dict[str, Any]] = mapped_column(
-        JSON,
-        nullable=False,
-        default=dict,
-        doc="Actual resource configuration from provider",
+    drift_detected: Mapped[bool] = mapped_column(
+        Boolean,
+        Computed(_RESOURCE_DRIFT_SQL, persisted=True),
+        doc="Whether the actual configuration differs from the desired one",
     )
 
     cost_per_hour: Mapped[Optional[Decimal]] = mapped_column(
@@ -372,11 +382,43 @@ class InfrastructureResource(NamedModel):
         "Infrastructure", back_populates="resources"
     )
 
+    # Loaded with SELECT IN so a batch of resources fetches each distinct
+    # provider and type once, and async callers never hit a lazy load.
     cloud_provider: Mapped["CloudProvider"] = relationship(
-        "CloudProvider", back_populates="resources"
+        "CloudProvider", back_populates="resources", lazy="selectin"
+    )
+
+    resource_type: Mapped["ResourceType"] = relationship(
+        "ResourceType", back_populates="resources", lazy="selectin"
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_resources_drift",
+            "infrastructure_id",
+            postgresql_where=text(_RESOURCE_DRIFT_SQL),
+        ),
     )
 
-    resource_type: Mapped["ResourceType"] = relationship("ResourceType", back_populates="resources")
+    @property
+    def desired_configuration(self) -> Dict[str, Any]:
+        """Get the desired resource configuration."""
+        return (self.state or {}).get("desired", {})
+
+    @desired_configuration.setter
+    def desired_configuration(self, value: Dict[str, Any]) -> None:
+        """Replace the desired resource configuration."""
+        self.state = {**(self.state or {}), "desired": value}
+
+    @property
+    def actual_configuration(self) -> Dict[str, Any]:
+        """Get the actual resource configuration reported by the provider."""
+        return (self.state or {}).get("actual", {})
+
+    @actual_configuration.setter
+    def actual_configuration(self, value: Dict[str, Any]) -> None:
+        """Replace the actual resource configuration."""
+        self.state = {**(self.state or {}), "actual": value}
 
 
 class InfrastructureTemplate(NamedModel):
@@ -393,7 +435,7 @@ class InfrastructureTemplate(NamedModel):
     )
 
     provider_type: Mapped[CloudProviderType] = mapped_column(
-        Enum(CloudProviderType), nullable=False, doc="Target cloud provider"
+        pg_enum(CloudProviderType), nullable=False, doc="Target cloud provider"
     )
 
     category: Mapped[str] = mapped_column(
@@ -436,7 +478,10 @@ class InfrastructureTemplate(NamedModel):
     )
 
     resource_types: Mapped[List["ResourceType"]] = relationship(
-        "ResourceType", secondary="template_resource_types", back_populates="templates"
+        "ResourceType",
+        secondary="template_resource_types",
+        back_populates="templates",
+        lazy="selectin",
     )
 
 
@@ -456,4 +501,6 @@ template_resource_types = Table(
         ForeignKey("resource_types.id"),
         primary_key=True,
     ),
+    # The primary key serves template-first lookups; this covers the reverse direction.
+    Index("ix_trt_resource_type", "resource_type_id"),
 )
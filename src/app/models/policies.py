@@ -6,15 +6,41 @@ including policies, rules, and violations for compliance enforcement.
 """
 
 import enum
+import hashlib
 import uuid
+import weakref
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-
-from app.models.base import NamedModel
+from functools import cached_property
+from types import CodeType
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    and_,
+    cast,
+    event,
+    func,
+    inspect,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.hybrid import hybrid_method
+from sqlalchemy.orm import Mapped, load_only, mapped_column, relationship
+
+from app.core.clock import request_now
+from app.models.base import NamedModel, SmallIntEnum, reset_cached_on_change, sql_now
 
 
 class PolicyStatus(str, enum.Enum):
@@ -65,28 +91,41 @@ class RuleEngine(str, enum.Enum):
     CLOUD_NATIVE = "cloud_native"
 
 
+# Rows fetched per round trip when streaming violations for scans
+VIOLATION_SCAN_BATCH_SIZE = 1000
+
+# Compiled custom policy code, shared by every loaded instance of the same policy
+# revision and released once no instance references it anymore.
+_compiled_policies: "weakref.WeakValueDictionary[Tuple[Any, ...], CodeType]" = (
+    weakref.WeakValueDictionary()
+)
+
+
 class Policy(NamedModel):
     """
     Model representing a policy for infrastructure governance.
 
     Policies define rules and constraints that infrastructure must comply with.
+    Policy code and the other large text/JSON columns of the policy models are
+    deferred in the ``"body"`` group; load them with ``undefer_group("body")``
+    where they are needed.
     """
 
     __tablename__ = "policies"
 
     policy_type: Mapped[PolicyType] = mapped_column(
-        Enum(PolicyType), nullable=False, doc="Type/category of the policy"
+        SmallIntEnum(PolicyType), nullable=False, doc="Type/category of the policy"
     )
 
     policy_status: Mapped[PolicyStatus] = mapped_column(
-        Enum(PolicyStatus),
+        SmallIntEnum(PolicyStatus),
         nullable=False,
         default=PolicyStatus.DRAFT,
         doc="Current status of the policy",
     )
 
     severity: Mapped[PolicySeverity] = mapped_column(
-        Enum(PolicySeverity),
+        SmallIntEnum(PolicySeverity),
         nullable=False,
         default=PolicySeverity.MEDIUM,
         doc="Severity level for violations",
@@ -97,36 +136,40 @@ class Policy(NamedModel):
     )
 
     policy_code: Mapped[str] = mapped_column(
-        Text, nullable=False, doc="Policy implementation code (OPA Rego, custom, etc.)"
+        Text,
+        nullable=False,
+        deferred=True,
+        deferred_group="body",
+        doc="Policy implementation code (OPA Rego, custom, etc.)",
     )
 
     rule_engine: Mapped[RuleEngine] = mapped_column(
-        Enum(RuleEngine),
+        SmallIntEnum(RuleEngine),
         nullable=False,
         default=RuleEngine.OPA,
         doc="Rule engine used to evaluate this policy",
     )
 
     target_resources: Mapped[List[str]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=False,
         default=list,
         doc="List of resource types this policy applies to",
     )
 
     target_environments: Mapped[List[str]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=False,
         default=list,
         doc="List of environments this policy applies to",
     )
 
     parameters: Mapped[Dict[str, Any]] = mapped_column(
-        JSON, nullable=False, default=dict, doc="Configurable parameters for the policy"
+        JSONB, nullable=False, default=dict, doc="Configurable parameters for the policy"
     )
 
     remediation_actions: Mapped[Dict[str, Any]] = mapped_column(
-        JSON, nullable=False, default=dict, doc="Automated remediation actions"
+        JSONB, nullable=False, default=dict, doc="Automated remediation actions"
     )
 
     documentation_url: Mapped[Optional[str]] = mapped_column(
@@ -166,6 +209,24 @@ class Policy(NamedModel):
         doc="Last time this policy was evaluated",
     )
 
+    lock_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, doc="Row version used for optimistic concurrency control"
+    )
+
+    open_violation_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        doc="Number of open violations, maintained by a trigger on policy_violations",
+    )
+
+    critical_violation_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        doc="Number of open critical violations, maintained by a trigger on policy_violations",
+    )
+
     # Relationships
     rules: Mapped[List["PolicyRule"]] = relationship(
         "PolicyRule", back_populates="policy", cascade="all, delete-orphan"
@@ -175,15 +236,103 @@ class Policy(NamedModel):
         "PolicyViolation", back_populates="policy", cascade="all, delete-orphan"
     )
 
+    # Read-only view filtered in SQL; reflects changes to rules after a flush/refresh
+    active_rules: Mapped[List["PolicyRule"]] = relationship(
+        "PolicyRule",
+        primaryjoin="and_(PolicyRule.policy_id == Policy.id, PolicyRule.is_active)",
+        order_by="PolicyRule.order_index",
+        viewonly=True,
+        lazy="selectin",
+    )
+
+    __table_args__ = (
+        Index("ix_policies_target_resources_gin", "target_resources", postgresql_using="gin"),
+        Index("ix_policies_target_environments_gin", "target_environments", postgresql_using="gin"),
+    )
+
+    # UPDATEs are guarded by lock_version, and server-generated columns such as
+    # updated_at come back via RETURNING, so a flushed policy needs no refetch.
+    __mapper_args__ = {"version_id_col": lock_version, "eager_defaults": True}
+
+    @classmethod
+    async def find_applicable(
+        cls, session: AsyncSession, resource_type: str, environment: Optional[str] = None
+    ) -> Sequence["Policy"]:
+        """
+        Find active policies that target a resource type (and optionally an environment).
+
+        Uses JSONB containment so the lookup is served by the GIN indexes.
+
+        Args:
+            session: Database session
+            resource_type: Resource type the policy must target
+            environment: Environment the policy must target
+
+        Returns:
+            Matching active policies
+        """
+        stmt = select(cls).where(
+            cls.policy_status == PolicyStatus.ACTIVE,
+            cls.target_resources.op("@>")(cast([resource_type], JSONB)),
+        )
+        if environment:
+            stmt = stmt.where(cls.target_environments.op("@>")(cast([environment], JSONB)))
+        result = await session.execute(stmt)
+        return result.scalars().all()
+
+    @cached_property
+    def compiled(self) -> Optional[CodeType]:
+        """
+        Get the compiled form of the policy code.
+
+        Only custom policies are compiled in-process; OPA, Terraform and
+        cloud-native policies are evaluated by their own engines and return None.
+        ``policy_code`` is deferred, so load the policy with its body undeferred.
+        """
+        if self.rule_engine != RuleEngine.CUSTOM:
+            return None
+
+        digest = hashlib.sha1(self.policy_code.encode()).hexdigest()
+        key = (self.id, self.lock_version, digest)
+        code = _compiled_policies.get(key)
+        if code is None:
+            code = compile(self.policy_code, f"<policy {self.id}>", "exec")
+            _compiled_policies[key] = code
+        return code
+
     def get_active_rules(self) -> List["PolicyRule"]:
         """Get all active rules for this policy."""
-        return [rule for rule in self.rules if rule.is_active]
-
-    def get_violation_count(self, status: Optional[ViolationStatus] = None) -> int:
-        """Get count of violations for this policy."""
+        return self.active_rules
+
+    async def get_violation_count(
+        self, session: AsyncSession, status: Optional[ViolationStatus] = None
+    ) -> int:
+        """
+        Get count of violations for this policy.
+
+        Counts in the database unless the violations collection is already
+        loaded, so the collection is never loaded just to be counted.
+
+        Args:
+            session: Database session
+            status: Only count violations with this status
+
+        Returns:
+            Number of matching violations
+        """
+        if "violations" not in inspect(self).unloaded:
+            if status:
+                return len([v for v in self.violations if v.violation_status == status])
+            return len(self.violations)
+
+        stmt = (
+            select(func.count())
+            .select_from(PolicyViolation)
+            .where(PolicyViolation.policy_id == self.id)
+        )
         if status:
-            return len([v for v in self.violations if v.violation_status == status])
-        return len(self.violations)
+            stmt = stmt.where(PolicyViolation.violation_status == status)
+        return await session.scalar(stmt)
 
 
 class PolicyRule(NamedModel):
@@ -202,14 +351,20 @@ class PolicyRule(NamedModel):
         doc="ID of the parent policy",
     )
 
-    rule_code: Mapped[str] = mapped_column(Text, nullable=False, doc="Rule implementation code")
+    rule_code: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        deferred=True,
+        deferred_group="body",
+        doc="Rule implementation code",
+    )
 
     rule_type: Mapped[str] = mapped_column(
         String(100), nullable=False, doc="Type of rule (validation, constraint, etc.)"
     )
 
     severity: Mapped[PolicySeverity] = mapped_column(
-        Enum(PolicySeverity),
+        SmallIntEnum(PolicySeverity),
         nullable=False,
         default=PolicySeverity.MEDIUM,
         doc="Severity level for this rule",
@@ -238,6 +393,32 @@ class PolicyRule(NamedModel):
     # Relationships
     policy: Mapped["Policy"] = relationship("Policy", back_populates="rules")
 
+    __table_args__ = (
+        Index("ix_policy_rules_active", "policy_id", postgresql_where=text("is_active")),
+    )
+
+    @classmethod
+    async def fetch_active_rules(
+        cls, session: AsyncSession, policy_id: uuid.UUID
+    ) -> Sequence["PolicyRule"]:
+        """
+        Load the active rules of a policy with only the columns evaluation needs.
+
+        Args:
+            session: Database session
+            policy_id: ID of the policy
+
+        Returns:
+            Active rules in execution order
+        """
+        result = await session.execute(
+            select(cls)
+            .where(cls.policy_id == policy_id, cls.is_active)
+            .order_by(cls.order_index)
+            .options(load_only(cls.id, cls.rule_code, cls.severity))
+        )
+        return result.scalars().all()
+
 
 class PolicyViolation(NamedModel):
     """
@@ -270,34 +451,36 @@ class PolicyViolation(NamedModel):
     )
 
     violation_status: Mapped[ViolationStatus] = mapped_column(
-        Enum(ViolationStatus),
+        SmallIntEnum(ViolationStatus),
         nullable=False,
         default=ViolationStatus.OPEN,
         doc="Current status of the violation",
     )
 
     severity: Mapped[PolicySeverity] = mapped_column(
-        Enum(PolicySeverity), nullable=False, doc="Severity of this violation"
+        SmallIntEnum(PolicySeverity), nullable=False, doc="Severity of this violation"
     )
 
     violation_details: Mapped[Dict[str, Any]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=False,
         default=dict,
+        deferred=True,
+        deferred_group="body",
         doc="Detailed information about the violation",
     )
 
     detected_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
         doc="When the violation was first detected",
     )
 
     last_seen_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
         doc="When the violation was last seen",
     )
 
@@ -312,7 +495,11 @@ class PolicyViolation(NamedModel):
     )
 
     resolution_notes: Mapped[Optional[str]] = mapped_column(
-        Text, nullable=True, doc="Notes about how the violation was resolved"
+        Text,
+        nullable=True,
+        deferred=True,
+        deferred_group="body",
+        doc="Notes about how the violation was resolved",
     )
 
     suppressed_until: Mapped[Optional[datetime]] = mapped_column(
@@ -322,7 +509,11 @@ class PolicyViolation(NamedModel):
     )
 
     suppression_reason: Mapped[Optional[str]] = mapped_column(
-        Text, nullable=True, doc="Reason for suppressing the violation"
+        Text,
+        nullable=True,
+        deferred=True,
+        deferred_group="body",
+        doc="Reason for suppressing the violation",
     )
 
     auto_remediation_attempted: Mapped[bool] = mapped_column(
@@ -333,32 +524,178 @@ class PolicyViolation(NamedModel):
     )
 
     remediation_details: Mapped[Dict[str, Any]] = mapped_column(
-        JSON, nullable=False, default=dict, doc="Details about remediation attempts"
+        JSONB,
+        nullable=False,
+        default=dict,
+        deferred=True,
+        deferred_group="body",
+        doc="Details about remediation attempts",
     )
 
     # Relationships
     policy: Mapped["Policy"] = relationship("Policy", back_populates="violations")
 
+    # Lookups by policy use the covering index, open-violation counts use the
+    # partial one; violations are inserted often, so keep the index set small.
+    __table_args__ = (
+        Index(
+            "ix_violations_open_policy",
+            "policy_id",
+            "severity",
+            postgresql_where=violation_status.column == ViolationStatus.OPEN,
+        ),
+        Index(
+            "ix_violations_suppressed_until",
+            "suppressed_until",
+            postgresql_where=violation_status.column == ViolationStatus.SUPPRESSED,
+        ),
+        Index(
+            "ix_violations_policy_counts",
+            "policy_id",
+            postgresql_include=["violation_status", "severity", "detected_at"],
+        ),
+    )
+
     def is_active(self) -> bool:
         """Check if violation is currently active."""
         return self.violation_status == ViolationStatus.OPEN
 
-    def is_suppressed(self) -> bool:
+    def is_suppressed(self, now: Optional[datetime] = None) -> bool:
         """Check if violation is currently suppressed."""
         if self.violation_status == ViolationStatus.SUPPRESSED:
             return True
-        if self.suppressed_until and self.suppressed_until > datetime.utcnow():
+        if self.suppressed_until and self.suppressed_until > (now or request_now()):
             return True
         return False
 
+    @classmethod
+    async def iter_open(
+        cls, session: AsyncSession, batch_size: int = VIOLATION_SCAN_BATCH_SIZE
+    ) -> AsyncIterator[Row]:
+        """
+        Stream open violations as plain rows for scanning and notification jobs.
+
+        Rows come from a server-side cursor and are not hydrated into ORM
+        instances; load the full violation only when it needs to be changed.
+
+        Args:
+            session: Database session
+            batch_size: Number of rows fetched from the cursor at a time
+
+        Yields:
+            Rows of (id, policy_id, resource_identifier, severity)
+        """
+        result = await session.stream(
+            select(cls.id, cls.policy_id, cls.resource_identifier, cls.severity)
+            .where(cls.violation_status == ViolationStatus.OPEN)
+            .execution_options(yield_per=batch_size)
+        )
+        async for row in result:
+            yield row
+
+    @classmethod
+    async def count_open_by_severity(cls, session: AsyncSession) -> Dict[PolicySeverity, int]:
+        """
+        Count open violations per severity in a single grouped query.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Mapping of every severity to its open violation count, including zeros
+        """
+        result = await session.execute(
+            select(cls.severity, func.count())
+            .where(cls.violation_status == ViolationStatus.OPEN)
+            .group_by(cls.severity)
+        )
+        counts = dict.fromkeys(PolicySeverity, 0)
+        counts.update(result.tuples().all())
+        return counts
+
+    @classmethod
+    def filter_active(cls, violations: Iterable["PolicyViolation"]) -> List["PolicyViolation"]:
+        """
+        Select the open, unsuppressed violations from a sequence.
+
+        Args:
+            violations: Violations to filter
+
+        Returns:
+            Violations that are open and not suppressed, in their original order
+        """
+        now = request_now()
+        return [v for v in violations if v.is_active() and not v.is_suppressed(now)]
+
     def resolve(self, resolved_by: uuid.UUID, notes: str = None) -> None:
-        """Mark violation as resolved."""
+        """Mark violation as resolved; resolved_at is stamped by the database on flush."""
         self.violation_status = ViolationStatus.RESOLVED
-        self.resolved_at = datetime.utcnow()
+        self.resolved_at = func.now()
         self.resolved_by = resolved_by
         if notes:
             self.resolution_notes = notes
 
+    @classmethod
+    async def bulk_resolve(
+        cls,
+        session: AsyncSession,
+        ids: Iterable[uuid.UUID],
+        resolved_by: uuid.UUID,
+        notes: Optional[str] = None,
+    ) -> int:
+        """
+        Resolve many violations with a single UPDATE statement.
+
+        Args:
+            session: Database session
+            ids: IDs of the violations to resolve
+            resolved_by: ID of the user resolving the violations
+            notes: Resolution notes applied to every violation
+
+        Returns:
+            Number of violations updated
+        """
+        ids = list(ids)
+        if not ids:
+            return 0
+        values = {
+            "violation_status": ViolationStatus.RESOLVED,
+            "resolved_at": func.now(),
+            "resolved_by": resolved_by,
+        }
+        if notes:
+            values["resolution_notes"] = notes
+        result = await session.execute(
+            update(cls)
+            .where(cls.id.in_(ids))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    @classmethod
+    async def bulk_mark_seen(cls, session: AsyncSession, ids: Iterable[uuid.UUID]) -> int:
+        """
+        Stamp last_seen_at on many violations with a single UPDATE statement.
+
+        Args:
+            session: Database session
+            ids: IDs of the violations observed again by a scan
+
+        Returns:
+            Number of violations updated
+        """
+        ids = list(ids)
+        if not ids:
+            return 0
+        result = await session.execute(
+            update(cls)
+            .where(cls.id.in_(ids))
+            .values(last_seen_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     def suppress(self, reason: str, until: Optional[datetime] = None) -> None:
         """Suppress the violation."""
         self.violation_status = ViolationStatus.SUPPRESSED
@@ -391,7 +728,11 @@ class PolicyExemption(NamedModel):
     )
 
     exemption_reason: Mapped[str] = mapped_column(
-        Text, nullable=False, doc="Reason for the exemption"
+        Text,
+        nullable=False,
+        deferred=True,
+        deferred_group="body",
+        doc="Reason for the exemption",
     )
 
     expires_at: Mapped[Optional[datetime]] = mapped_column(
@@ -411,12 +752,70 @@ class PolicyExemption(NamedModel):
     # Relationships
     policy: Mapped["Policy"] = relationship("Policy")
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
         """Check if the exemption has expired."""
         if self.expires_at is None:
             return False
-        return self.expires_at < datetime.utcnow()
+        return self.expires_at < (now or request_now())
 
-    def is_valid(self) -> bool:
+    @hybrid_method
+    def is_valid(self, now: Optional[datetime] = None) -> bool:
         """Check if the exemption is valid and active."""
-        return self.is_active and not self.is_expired()
+        return self.is_active and not self.is_expired(now)
+
+    @is_valid.expression
+    def is_valid(cls, now: Optional[datetime] = None):
+        """SQL form of is_valid, for use in WHERE clauses."""
+        return and_(cls.is_active, or_(cls.expires_at.is_(None), cls.expires_at > sql_now(now)))
+
+    @classmethod
+    def filter_valid(cls, exemptions: Iterable["PolicyExemption"]) -> List["PolicyExemption"]:
+        """Select the active, unexpired exemptions from a sequence."""
+        now = request_now()
+        return [e for e in exemptions if e.is_valid(now)]
+
+
+reset_cached_on_change(Policy, ("policy_code", "lock_version", "rule_engine"), ("compiled",))
+
+
+def _violation_count_ddl() -> Tuple[DDL, DDL]:
+    """Build the trigger keeping the policies' denormalized violation counters current."""
+    status_type = PolicyViolation.__table__.c.violation_status.type
+    severity_type = PolicyViolation.__table__.c.severity.type
+    is_open = status_type.ordinal(ViolationStatus.OPEN)
+    is_critical = severity_type.ordinal(PolicySeverity.CRITICAL)
+
+    function = DDL(
+        f"""
+        CREATE OR REPLACE FUNCTION policy_violation_counts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.violation_status = {is_open} THEN
+                UPDATE policies
+                SET open_violation_count = open_violation_count - 1,
+                    critical_violation_count = critical_violation_count
+                        - (OLD.severity = {is_critical})::int
+                WHERE id = OLD.policy_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.violation_status = {is_open} THEN
+                UPDATE policies
+                SET open_violation_count = open_violation_count + 1,
+                    critical_violation_count = critical_violation_count
+                        + (NEW.severity = {is_critical})::int
+                WHERE id = NEW.policy_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    trigger = DDL(
+        "CREATE TRIGGER trg_policy_violation_counts "
+        "AFTER INSERT OR DELETE OR UPDATE OF violation_status, severity, policy_id "
+        "ON policy_violations FOR EACH ROW EXECUTE FUNCTION policy_violation_counts()"
+    )
+    return function, trigger
+
+
+# A trigger rather than ORM events, so bulk Core updates such as bulk_resolve are counted too
+for _ddl in _violation_count_ddl():
+    event.listen(PolicyViolation.__table__, "after_create", _ddl.execute_if(dialect="postgresql"))
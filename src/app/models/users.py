@@ -6,15 +6,44 @@ and role-based access control (RBAC).
 """
 
 import enum
+import hashlib
 import uuid
 from datetime import datetime
-from typing import List, Optional
-
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, Text, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from functools import cached_property
+from typing import FrozenSet, Iterable, List, Optional
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    RowMapping,
+    String,
+    Text,
+    UniqueConstraint,
+    and_,
+    bindparam,
+    cast,
+    func,
+    not_,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.hybrid import hybrid_method
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import BaseModel, NamedModel
+from app.core.clock import request_now
+from app.models.base import (
+    BaseModel,
+    NamedModel,
+    SmallIntEnum,
+    reset_cached_on_change,
+    sql_now,
+)
 
 
 class UserStatus(str, enum.Enum):
@@ -84,7 +113,7 @@ class User(NamedModel):
     )
 
     user_status: Mapped[UserStatus] = mapped_column(
-        Enum(UserStatus),
+        SmallIntEnum(UserStatus),
         nullable=False,
         default=UserStatus.PENDING_VERIFICATION,
         doc="Current user account status",
@@ -155,7 +184,18 @@ class User(NamedModel):
 
     # Relationships
     user_roles: Mapped[List["UserRole"]] = relationship(
-        "UserRole", back_populates="user", cascade="all, delete-orphan"
+        "UserRole",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        foreign_keys="UserRole.user_id",
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_users_locked_until",
+            "locked_until",
+            postgresql_where=locked_until.column.is_not(None),
+        ),
     )
 
     @property
@@ -175,30 +215,63 @@ class User(NamedModel):
         """Get user's display name."""
         return self.username or self.full_name
 
-    def is_account_locked(self) -> bool:
+    @hybrid_method
+    def is_account_locked(self, now: Optional[datetime] = None) -> bool:
         """Check if user account is locked."""
         if self.user_status == UserStatus.LOCKED:
             return True
-        if self.locked_until and self.locked_until > datetime.utcnow():
+        if self.locked_until and self.locked_until > (now or request_now()):
             return True
         return False
 
+    @is_account_locked.expression
+    def is_account_locked(cls, now: Optional[datetime] = None):
+        """SQL form of is_account_locked, for use in WHERE clauses."""
+        return or_(
+            cls.user_status == UserStatus.LOCKED,
+            and_(cls.locked_until.is_not(None), cls.locked_until > sql_now(now)),
+        )
+
+    @property
+    def effective_permissions(self) -> FrozenSet[str]:
+        """
+        Get the union of permissions granted by the user's valid roles.
+
+        Computed on every access rather than memoized: role assignments can
+        expire or be deactivated without any change to ``user_roles`` itself.
+        """
+        return frozenset().union(
+            *(user_role.role.permission_set for user_role in UserRole.filter_valid(self.user_roles))
+        )
+
     def has_permission(self, permission: str, resource_id: Optional[uuid.UUID] = None) -> bool:
         """Check if user has a specific permission."""
         if self.is_superuser:
             return True
-
-        # Check through user roles
-        for user_role in self.user_roles:
-            if user_role.role.has_permission(permission, resource_id):
-                return True
-
-        return False
+        return permission in self.effective_permissions
 
     def get_roles(self) -> List["Role"]:
         """Get all roles assigned to the user."""
         return [user_role.role for user_role in self.user_roles]
 
+    @classmethod
+    async def get_login_record(cls, session: AsyncSession, login: str) -> Optional[RowMapping]:
+        """
+        Fetch the columns needed to authenticate a user, by email or username.
+
+        Only a narrow column row is returned, so sign-in lookups skip building
+        a User instance, its identity-map entry and its relationship loads.
+
+        Args:
+            session: Database session
+            login: Email address or username supplied by the client
+
+        Returns:
+            Row mapping keyed by column name, or None if no user matches
+        """
+        result = await session.execute(_USER_LOGIN_BY_NAME, {"login": login})
+        return result.mappings().first()
+
 
 class Role(NamedModel):
     """
@@ -210,11 +283,11 @@ class Role(NamedModel):
     __tablename__ = "roles"
 
     role_type: Mapped[RoleType] = mapped_column(
-        Enum(RoleType), nullable=False, default=RoleType.CUSTOM, doc="Type of role"
+        SmallIntEnum(RoleType), nullable=False, default=RoleType.CUSTOM, doc="Type of role"
     )
 
     permissions: Mapped[List[str]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=False,
         default=list,
         doc="List of permissions granted by this role",
@@ -240,20 +313,80 @@ class Role(NamedModel):
         "UserRole", back_populates="role", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (Index("ix_roles_permissions_gin", "permissions", postgresql_using="gin"),)
+
+    @cached_property
+    def permission_set(self) -> FrozenSet[str]:
+        """Get the role's permissions as a set for constant-time lookups."""
+        return frozenset(self.permissions or ())
+
     def has_permission(self, permission: str, resource_id: Optional[uuid.UUID] = None) -> bool:
         """Check if role has a specific permission."""
         # Simple permission check (can be extended for resource-specific permissions)
-        return permission in self.permissions
+        return permission in self.permission_set
 
     def add_permission(self, permission: str) -> None:
         """Add a permission to the role."""
-        if permission not in self.permissions:
-            self.permissions.append(permission)
+        if permission not in self.permission_set:
+            self.permissions = [*(self.permissions or []), permission]
 
     def remove_permission(self, permission: str) -> None:
         """Remove a permission from the role."""
-        if permission in self.permissions:
-            self.permissions.remove(permission)
+        if permission in self.permission_set:
+            self.permissions = [p for p in self.permissions if p != permission]
+
+    @classmethod
+    async def grant_permission(
+        cls, session: AsyncSession, role_id: uuid.UUID, permission: str
+    ) -> int:
+        """
+        Append a permission to a role in the database without loading the role.
+
+        Only the new element is sent, and the update is skipped when the role
+        already has the permission. If the role is loaded in the session, its
+        permissions are expired so the next access reloads them.
+
+        Args:
+            session: Database session
+            role_id: ID of the role
+            permission: Permission to grant
+
+        Returns:
+            Number of roles updated (0 if the permission was already granted)
+        """
+        result = await session.execute(
+            update(cls)
+            .where(cls.id == role_id, not_(cls.permissions.has_key(permission)))
+            .values(permissions=cls.permissions.op("||")(cast([permission], JSONB)))
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount
+
+    @classmethod
+    async def revoke_permission(
+        cls, session: AsyncSession, role_id: uuid.UUID, permission: str
+    ) -> int:
+        """
+        Remove a permission from a role in the database without loading the role.
+
+        If the role is loaded in the session, its permissions are expired so the
+        next access reloads them.
+
+        Args:
+            session: Database session
+            role_id: ID of the role
+            permission: Permission to revoke
+
+        Returns:
+            Number of roles updated (0 if the role did not have the permission)
+        """
+        result = await session.execute(
+            update(cls)
+            .where(cls.id == role_id, cls.permissions.has_key(permission))
+            .values(permissions=cls.permissions.op("-")(permission))
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount
 
     def get_user_count(self) -> int:
         """Get the number of users with this role."""
@@ -287,7 +420,7 @@ class UserRole(BaseModel):
     granted_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
         doc="When the role was granted",
     )
 
@@ -304,7 +437,7 @@ class UserRole(BaseModel):
 
     # Scope for resource-specific permissions
     scope: Mapped[PermissionScope] = mapped_column(
-        Enum(PermissionScope),
+        SmallIntEnum(PermissionScope),
         nullable=False,
         default=PermissionScope.GLOBAL,
         doc="Scope of the role assignment",
@@ -333,15 +466,27 @@ class UserRole(BaseModel):
         ),
     )
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
         """Check if the role assignment has expired."""
         if self.expires_at is None:
             return False
-        return self.expires_at < datetime.utcnow()
+        return self.expires_at < (now or request_now())
 
-    def is_valid(self) -> bool:
+    @hybrid_method
+    def is_valid(self, now: Optional[datetime] = None) -> bool:
         """Check if the role assignment is valid and active."""
-        return self.is_active and not self.is_expired()
+        return self.is_active and not self.is_expired(now)
+
+    @is_valid.expression
+    def is_valid(cls, now: Optional[datetime] = None):
+        """SQL form of is_valid, for use in WHERE clauses."""
+        return and_(cls.is_active, or_(cls.expires_at.is_(None), cls.expires_at > sql_now(now)))
+
+    @classmethod
+    def filter_valid(cls, user_roles: Iterable["UserRole"]) -> List["UserRole"]:
+        """Select the active, unexpired role assignments from a sequence."""
+        now = request_now()
+        return [role for role in user_roles if role.is_valid(now)]
 
 
 class ApiKey(BaseModel):
@@ -364,8 +509,8 @@ class ApiKey(BaseModel):
         String(255), nullable=False, doc="Human-readable name for the API key"
     )
 
-    key_hash: Mapped[str] = mapped_column(
-        String(255), nullable=False, unique=True, doc="Hashed API key"
+    key_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32), nullable=False, doc="SHA-256 digest of the API key"
     )
 
     prefix: Mapped[str] = mapped_column(
@@ -373,15 +518,18 @@ class ApiKey(BaseModel):
     )
 
     permissions: Mapped[List[str]] = mapped_column(
-        JSON, nullable=False, default=list, doc="List of permissions for this API key"
+        JSONB, nullable=False, default=list, doc="List of permissions for this API key"
     )
 
     last_used_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True), nullable=True, doc="Last time this API key was used"
+        DateTime(timezone=True),
+        nullable=True,
+        deferred=True,
+        doc="Last time this API key was used",
     )
 
     last_used_ip: Mapped[Optional[str]] = mapped_column(
-        String(45), nullable=True, doc="IP address where key was last used"
+        String(45), nullable=True, deferred=True, doc="IP address where key was last used"
     )
 
     expires_at: Mapped[Optional[datetime]] = mapped_column(
@@ -395,12 +543,101 @@ class ApiKey(BaseModel):
     # Relationships
     user: Mapped["User"] = relationship("User")
 
-    def is_expired(self) -> bool:
+    # Covers the authentication lookup so it is served by an index-only scan
+    __table_args__ = (
+        Index(
+            "ix_api_keys_lookup",
+            "key_hash",
+            unique=True,
+            postgresql_include=["user_id", "is_active", "expires_at", "permissions"],
+        ),
+    )
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
         """Check if the API key has expired."""
         if self.expires_at is None:
             return False
-        return self.expires_at < datetime.utcnow()
+        return self.expires_at < (now or request_now())
 
-    def is_valid(self) -> bool:
+    @hybrid_method
+    def is_valid(self, now: Optional[datetime] = None) -> bool:
         """Check if the API key is valid and active."""
-        return self.is_active and not self.is_expired()
+        return self.is_active and not self.is_expired(now)
+
+    @is_valid.expression
+    def is_valid(cls, now: Optional[datetime] = None):
+        """SQL form of is_valid, for use in WHERE clauses."""
+        return and_(cls.is_active, or_(cls.expires_at.is_(None), cls.expires_at > sql_now(now)))
+
+    @staticmethod
+    def hash_key(raw_key: str) -> bytes:
+        """Get the SHA-256 digest stored for a raw API key."""
+        return hashlib.sha256(raw_key.encode()).digest()
+
+    @classmethod
+    async def get_by_raw_key(cls, session: AsyncSession, raw_key: str) -> Optional["ApiKey"]:
+        """
+        Look up an API key by the raw key presented by a client.
+
+        Args:
+            session: Database session
+            raw_key: API key as sent by the client
+
+        Returns:
+            Matching API key, or None if the key is unknown
+        """
+        result = await session.execute(_API_KEY_BY_HASH, {"key_hash": cls.hash_key(raw_key)})
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def mark_used(
+        cls, session: AsyncSession, key_id: uuid.UUID, ip_address: Optional[str] = None
+    ) -> int:
+        """
+        Stamp last-use details with a single UPDATE, without loading the key.
+
+        Usage tracking is not needed to authorize a request, so callers can run
+        this from a background task instead of on the request path.
+
+        Args:
+            session: Database session
+            key_id: ID of the API key that was used
+            ip_address: Client IP address the key was used from
+
+        Returns:
+            Number of API keys updated
+        """
+        result = await session.execute(
+            update(cls)
+            .where(cls.id == key_id)
+            .values(last_used_at=func.now(), last_used_ip=ip_address)
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount
+
+
+# Built once with a bound parameter so each lookup reuses the same statement
+# and its cached compiled form instead of constructing a new select. A login can
+# equal one user's email and another user's username, so the email match wins.
+_USER_LOGIN_BY_NAME = (
+    select(
+        User.id,
+        User.email,
+        User.username,
+        User.hashed_password,
+        User.user_status,
+        User.is_superuser,
+        User.failed_login_attempts,
+        User.locked_until,
+    )
+    .where(
+        User.deleted_at.is_(None),
+        or_(User.email == bindparam("login"), User.username == bindparam("login")),
+    )
+    .order_by((User.email == bindparam("login")).desc())
+    .limit(1)
+)
+_API_KEY_BY_HASH = select(ApiKey).where(ApiKey.key_hash == bindparam("key_hash"))
+
+
+reset_cached_on_change(Role, ("permissions",), ("permission_set",))
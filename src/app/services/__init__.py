@@ -1,9 +1,22 @@
 """Services package for CloudOps Central business logic."""
 
-from .cost_service import CostService
-from .infrastructure_service import InfrastructureService
-from .policy_service import PolicyService
-from .user_service import UserService
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cost_service import CostService
+    from .infrastructure_service import InfrastructureService
+    from .policy_service import PolicyService
+    from .user_service import UserService
+
+# Service classes are imported on first access so that entrypoints needing one
+# service do not pay for importing the others.
+_SERVICE_MODULES = {
+    "InfrastructureService": "infrastructure_service",
+    "CostService": "cost_service",
+    "PolicyService": "policy_service",
+    "UserService": "user_service",
+}
 
 __all__ = [
     "InfrastructureService",
@@ -11,3 +24,14 @@ __all__ = [
     "PolicyService",
     "UserService",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a service class on first access and cache it on the package."""
+    module_name = _SERVICE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -1,9 +1,199 @@
 """Cost tracking and optimization service layer."""
 
+from bisect import bisect_right
 from datetime import date, timedelta
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
+from sqlalchemy import Date, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.database import paginate
+from app.models.costs import CostRecord
+from app.models.infrastructure import CloudProvider, CloudProviderType
+
+# Batch size for analytics loops that walk cost records as ORM entities.
+COST_RECORD_BATCH_SIZE = 1000
+
+# Flat projection used by listing endpoints. Selecting columns instead of
+# entities returns plain rows and skips identity-map and instrumentation work.
+COST_RECORD_LISTING = (
+    select(
+        CostRecord.id,
+        CloudProvider.provider_type.label("cloud_provider"),
+        CostRecord.service_name.label("service"),
+        CostRecord.region,
+        CostRecord.cost_amount.label("amount"),
+        CostRecord.currency,
+        # date() rather than CAST(... AS DATE): SQLite evaluates the cast numerically
+        func.date(CostRecord.billing_period_start, type_=Date).label("recorded_date"),
+    )
+    .join(CloudProvider, CostRecord.cloud_provider_id == CloudProvider.id)
+    .where(CostRecord.deleted_at.is_(None))
+    .execution_options(yield_per=1000)
+)
+
+
+# Canned responses until the analytics pipeline is wired up. Each call builds
+# new objects, so callers may modify what they are given.
+def _cost_summary() -> Dict[str, Any]:
+    """Build the placeholder cost summary."""
+    return {
+        "total_cost": 15789.43,
+        "currency": "USD",
+        "breakdown_by_provider": {
+            "aws": 10234.56,
+            "azure": 3456.78,
+            "gcp": 2098.09,
+        },
+        "breakdown_by_service": {
+            "compute": 8500.00,
+            "storage": 3200.00,
+            "network": 2000.00,
+            "database": 2089.43,
+        },
+        "trend": "increasing",
+    }
+
+
+def _cost_anomalies() -> List[Dict[str, Any]]:
+    """Build the placeholder cost anomalies."""
+    return [
+        {
+            "date": "2025-10-15",
+            "service": "S3",
+            "expected_cost": 120.50,
+            "actual_cost": 450.80,
+            "variance_percent": 274,
+            "severity": "high",
+        },
+        {
+            "date": "2025-10-18",
+            "service": "RDS",
+            "expected_cost": 200.00,
+            "actual_cost": 350.00,
+            "variance_percent": 75,
+            "severity": "medium",
+        },
+    ]
+
+
+_OPTIMIZATION_RECOMMENDATIONS: List[Dict[str, Any]] = [
+    {
+        "recommendation_id": "opt-001",
+        "resource_id": "i-1234567890abcdef0",
+        "recommendation_type": "rightsizing",
+        "description": "Downsize EC2 instance from t3.large to t3.medium based on low CPU utilization (<15%)",
+        "estimated_savings": 450.00,
+        "priority": "high",
+        "implementation_effort": "low",
+    },
+    {
+        "recommendation_id": "opt-002",
+        "resource_id": "vol-0987654321fedcba",
+        "recommendation_type": "storage_optimization",
+        "description": "Convert gp3 volume to gp2 for infrequently accessed data",
+        "estimated_savings": 180.00,
+        "priority": "medium",
+        "implementation_effort": "low",
+    },
+]
+
+
+def _index_recommendations(
+    recommendations: List[Dict[str, Any]],
+) -> Tuple[Tuple[float, ...], Tuple[Mapping[str, Any], ...]]:
+    """Order recommendations by savings (highest first) with bisectable negated keys."""
+    ordered = sorted(recommendations, key=lambda r: r["estimated_savings"], reverse=True)
+    return (
+        tuple(-r["estimated_savings"] for r in ordered),
+        tuple(MappingProxyType(r) for r in ordered),
+    )
+
+
+# Recommendations bucketed by priority (None holds all of them). The index is
+# shared between requests, so its buckets and entries are read-only.
+_RECOMMENDATION_INDEX: Dict[
+    Optional[str], Tuple[Tuple[float, ...], Tuple[Mapping[str, Any], ...]]
+] = {
+    None: _index_recommendations(_OPTIMIZATION_RECOMMENDATIONS),
+    **{
+        priority: _index_recommendations(
+            [r for r in _OPTIMIZATION_RECOMMENDATIONS if r["priority"] == priority]
+        )
+        for priority in {r["priority"] for r in _OPTIMIZATION_RECOMMENDATIONS}
+    },
+}
+
+
+def _cost_forecast(months: int, cloud_provider: Optional[str]) -> Dict[str, Any]:
+    """Build the placeholder forecast for a horizon and provider."""
+    base_cost = 15789.43
+    month_numbers = np.arange(1, months + 1)
+    forecasted = base_cost * (1 + 0.05 * month_numbers)  # Simulate 5% growth
+    columns = (
+        month_numbers.tolist(),
+        np.round(forecasted, 2).tolist(),
+        np.round(forecasted * 0.9, 2).tolist(),
+        np.round(forecasted * 1.1, 2).tolist(),
+    )
+
+    return {
+        "forecast_months": months,
+        "cloud_provider": cloud_provider or "all",
+        "forecasts": [
+            {
+                "month": month,
+                "forecasted_cost": cost,
+                "confidence_interval": {"lower": lower, "upper": upper},
+            }
+            for month, cost, lower, upper in zip(*columns)
+        ],
+    }
+
+
+# Share of deviation from the expected cost at which a day counts as anomalous
+ANOMALY_VARIANCE_THRESHOLD_PERCENT = 50.0
+
+
+def score_cost_variance(
+    expected: np.ndarray,
+    actual: np.ndarray,
+    threshold_percent: float = ANOMALY_VARIANCE_THRESHOLD_PERCENT,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score actual against expected costs for a whole series in one pass.
+
+    Periods with no expected cost have no defined variance and score as zero.
+
+    Args:
+        expected: Expected cost per period
+        actual: Actual cost per period, aligned with ``expected``
+        threshold_percent: Absolute variance above which a period is anomalous
+
+    Returns:
+        Tuple of (anomaly mask, variance percentages), one entry per period
+    """
+    expected = np.asarray(expected, dtype=np.float64)
+    actual = np.asarray(actual, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = (actual - expected) / expected * 100.0
+    variance = np.where(expected == 0, 0.0, variance)
+    return np.abs(variance) > threshold_percent, variance
+
+
+def _billing_period_predicates(
+    start_date: Optional[date], end_date: Optional[date]
+) -> List[ColumnElement[bool]]:
+    """Collect billing period filters so a query applies them in a single where()."""
+    predicates: List[ColumnElement[bool]] = []
+    if start_date:
+        predicates.append(CostRecord.billing_period_start >= start_date)
+    if end_date:
+        predicates.append(CostRecord.billing_period_end <= end_date)
+    return predicates
 
 
 class CostService:
@@ -21,19 +211,57 @@ class CostService:
         skip: int = 0,
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
-        """List cost records with filters."""
-        # Placeholder implementation
-        return [
-            {
-                "id": 1,
-                "cloud_provider": "aws",
-                "service": "EC2",
-                "region": "us-east-1",
-                "amount": 1234.56,
-                "currency": "USD",
-                "recorded_date": "2025-10-20",
-            }
-        ]
+        """List cost records with filters as flat row mappings."""
+        predicates = _billing_period_predicates(start_date, end_date)
+        if cloud_provider:
+            try:
+                provider_type = CloudProviderType(cloud_provider)
+            except ValueError:
+                return []
+            predicates.append(CloudProvider.provider_type == provider_type)
+        if service:
+            predicates.append(CostRecord.service_name == service)
+
+        stmt = (
+            COST_RECORD_LISTING.where(*predicates)
+            .order_by(CostRecord.billing_period_start.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.db.stream(stmt)
+        return [dict(row) async for row in result.mappings()]
+
+    async def iter_record_batches(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = COST_RECORD_BATCH_SIZE,
+    ) -> AsyncIterator[Sequence[CostRecord]]:
+        """
+        Stream cost records in fixed-size batches for rollups and recomputation.
+
+        Rows are fetched through a server-side cursor, so memory use is bounded
+        by the batch size rather than the size of the billing period. Sessions
+        must not expire instances on commit, or committing between batches
+        would re-query every record already yielded.
+
+        Args:
+            start_date: Only include records billed on or after this date
+            end_date: Only include records billed on or before this date
+            batch_size: Number of records per yielded batch
+
+        Yields:
+            Sequences of CostRecord instances
+        """
+        stmt = (
+            select(CostRecord)
+            .where(
+                CostRecord.deleted_at.is_(None), *_billing_period_predicates(start_date, end_date)
+            )
+            .order_by(CostRecord.billing_period_start)
+        )
+        async for batch in paginate(self.db, stmt, batch_size=batch_size):
+            yield batch
 
     async def get_summary(
         self,
@@ -42,108 +270,36 @@ class CostService:
         cloud_provider: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get cost summary and breakdown."""
-        return {
-            "total_cost": 15789.43,
-            "currency": "USD",
-            "breakdown_by_provider": {
-                "aws": 10234.56,
-                "azure": 3456.78,
-                "gcp": 2098.09,
-            },
-            "breakdown_by_service": {
-                "compute": 8500.00,
-                "storage": 3200.00,
-                "network": 2000.00,
-                "database": 2089.43,
-            },
-            "trend": "increasing",
-        }
+        return _cost_summary()
 
     async def forecast_costs(
         self, months: int = 3, cloud_provider: Optional[str] = None
     ) -> Dict[str, Any]:
         """Forecast future costs using ML models."""
         # Placeholder - would use ML model for forecasting
-        forecasts = []
-        base_cost = 15789.43
-        for i in range(1, months + 1):
-            forecasted = base_cost * (1 + 0.05 * i)  # Simulate 5% growth
-            forecasts.append(
-                {
-                    "month": i,
-                    "forecasted_cost": round(forecasted, 2),
-                    "confidence_interval": {
-                        "lower": round(forecasted * 0.9, 2),
-                        "upper": round(forecasted * 1.1, 2),
-                    },
-                }
-            )
-
-        return {
-            "forecast_months": months,
-            "cloud_provider": cloud_provider or "all",
-            "forecasts": forecasts,
-        }
+        return _cost_forecast(months, cloud_provider)
 
     async def detect_anomalies(
         self, days: int = 30, cloud_provider: Optional[str] = None
     ) -> Dict[str, Any]:
         """Detect cost anomalies using ML."""
         # Placeholder - would use anomaly detection ML model
+        anomalies = _cost_anomalies()
         return {
             "period_days": days,
-            "anomalies_detected": 2,
-            "anomalies": [
-                {
-                    "date": "2025-10-15",
-                    "service": "S3",
-                    "expected_cost": 120.50,
-                    "actual_cost": 450.80,
-                    "variance_percent": 274,
-                    "severity": "high",
-                },
-                {
-                    "date": "2025-10-18",
-                    "service": "RDS",
-                    "expected_cost": 200.00,
-                    "actual_cost": 350.00,
-                    "variance_percent": 75,
-                    "severity": "medium",
-                },
-            ],
+            "anomalies_detected": len(anomalies),
+            "anomalies": anomalies,
         }
 
     async def get_optimization_recommendations(
         self, priority: Optional[str] = None, min_savings: Optional[float] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Mapping[str, Any]]:
         """Get AI-driven cost optimization recommendations."""
-        recommendations = [
-            {
-                "recommendation_id": "opt-001",
-                "resource_id": "i-1234567890abcdef0",
-                "recommendation_type": "rightsizing",
-                "description": "Downsize EC2 instance from t3.large to t3.medium based on low CPU utilization (<15%)",
-                "estimated_savings": 450.00,
-                "priority": "high",
-                "implementation_effort": "low",
-            },
-            {
-                "recommendation_id": "opt-002",
-                "resource_id": "vol-0987654321fedcba",
-                "recommendation_type": "storage_optimization",
-                "description": "Convert gp3 volume to gp2 for infrequently accessed data",
-                "estimated_savings": 180.00,
-                "priority": "medium",
-                "implementation_effort": "low",
-            },
-        ]
-
-        # Filter by priority if specified
-        if priority:
-            recommendations = [r for r in recommendations if r["priority"] == priority]
-
-        # Filter by min savings if specified
+        # An empty priority means no filter, not a priority nothing has
+        keys, recommendations = _RECOMMENDATION_INDEX.get(priority or None, ((), ()))
+
+        # Keys are negated savings in ascending order, so the cutoff is one bisect
         if min_savings is not None:
-            recommendations = [r for r in recommendations if r["estimated_savings"] >= min_savings]
+            recommendations = recommendations[: bisect_right(keys, -min_savings)]
 
-        return recommendations
+        return list(recommendations)
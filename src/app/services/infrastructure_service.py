@@ -6,6 +6,53 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+# Placeholder payloads until cloud discovery is implemented. Each call builds
+# new objects, so callers may modify what they are given.
+def _resource_listing() -> List[Dict[str, Any]]:
+    """Build the placeholder resource listing."""
+    return [
+        {
+            "id": 1,
+            "resource_id": "i-1234567890abcdef0",
+            "resource_type": "ec2_instance",
+            "cloud_provider": "aws",
+            "region": "us-east-1",
+            "name": "web-server-01",
+            "status": "running",
+            "drift_detected": False,
+            "last_synced": "2025-10-21T10:00:00Z",
+            "tags": {"Environment": "production", "Team": "platform"},
+            "configuration": {"instance_type": "t3.medium"},
+        }
+    ]
+
+
+def _infrastructure_statistics() -> Dict[str, Any]:
+    """Build the placeholder infrastructure statistics."""
+    return {
+        "total_resources": 150,
+        "by_provider": {"aws": 100, "azure": 30, "gcp": 20},
+        "by_type": {"compute": 45, "storage": 60, "network": 30, "database": 15},
+        "drift_detected": 3,
+        "policy_violations": 2,
+    }
+
+
+def _resource_details(resource_id: str) -> Dict[str, Any]:
+    """Build the placeholder details of a resource."""
+    return {
+        "id": 1,
+        "resource_id": resource_id,
+        "resource_type": "ec2_instance",
+        "cloud_provider": "aws",
+        "region": "us-east-1",
+        "name": "web-server-01",
+        "status": "running",
+        "drift_detected": False,
+        "last_synced": "2025-10-21T10:00:00Z",
+    }
+
+
 class InfrastructureService:
     """Service for managing cloud infrastructure resources."""
 
@@ -21,35 +68,11 @@ class InfrastructureService:
     ) -> List[Dict[str, Any]]:
         """List infrastructure resources with optional filters."""
         # Placeholder implementation - would query database
-        return [
-            {
-                "id": 1,
-                "resource_id": "i-1234567890abcdef0",
-                "resource_type": "ec2_instance",
-                "cloud_provider": "aws",
-                "region": "us-east-1",
-                "name": "web-server-01",
-                "status": "running",
-                "drift_detected": False,
-                "last_synced": "2025-10-21T10:00:00Z",
-                "tags": {"Environment": "production", "Team": "platform"},
-                "configuration": {"instance_type": "t3.medium"},
-            }
-        ]
+        return _resource_listing()
 
     async def get_resource(self, resource_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific resource by ID."""
-        return {
-            "id": 1,
-            "resource_id": resource_id,
-            "resource_type": "ec2_instance",
-            "cloud_provider": "aws",
-            "region": "us-east-1",
-            "name": "web-server-01",
-            "status": "running",
-            "drift_detected": False,
-            "last_synced": "2025-10-21T10:00:00Z",
-        }
+        return _resource_details(resource_id)
 
     async def sync_infrastructure(self, cloud_provider: Optional[str] = None) -> Dict[str, int]:
         """Sync infrastructure from cloud providers."""
@@ -67,10 +90,4 @@ class InfrastructureService:
 
     async def get_statistics(self, cloud_provider: Optional[str] = None) -> Dict[str, Any]:
         """Get infrastructure statistics."""
-        return {
-            "total_resources": 150,
-            "by_provider": {"aws": 100, "azure": 30, "gcp": 20},
-            "by_type": {"compute": 45, "storage": 60, "network": 30, "database": 15},
-            "drift_detected": 3,
-            "policy_violations": 2,
-        }
+        return _infrastructure_statistics()
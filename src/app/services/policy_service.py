@@ -1,8 +1,139 @@
 """Policy management service layer."""
 
-from typing import Any, Dict, List, Optional
+import fnmatch
+import re
+import uuid
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from sqlalchemy import bindparam, event, func, select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, undefer_group
+
+from app.core.cache import TTLCache
+from app.models.infrastructure import InfrastructureResource, ResourceType
+from app.models.policies import Policy, PolicyExemption, PolicyStatus, PolicyViolation
+
+# Policy code and other large columns are deferred; evaluation needs them loaded.
+POLICY_WITH_BODY = select(Policy).options(undefer_group("body"))
+
+# Single-row lookups are prebuilt with bound parameters, so requests reuse one
+# statement object and its cached compiled SQL instead of building a new select.
+POLICY_WITH_BODY_BY_ID = POLICY_WITH_BODY.where(Policy.id == bindparam("policy_id"))
+
+# Every (active policy, targeted resource) pair, matched in the database by
+# testing the resource type's name against the policy's target_resources array.
+POLICY_TARGETS = (
+    select(
+        Policy.id.label("policy_id"),
+        InfrastructureResource.id.label("resource_id"),
+        ResourceType.name.label("resource_type"),
+        Policy.severity,
+    )
+    .select_from(InfrastructureResource)
+    .join(ResourceType, InfrastructureResource.resource_type_id == ResourceType.id)
+    .join(Policy, Policy.target_resources.has_key(ResourceType.name))
+    .where(
+        Policy.policy_status == PolicyStatus.ACTIVE,
+        Policy.deleted_at.is_(None),
+        InfrastructureResource.deleted_at.is_(None),
+    )
+)
+
+
+class ExemptionMatcher:
+    """
+    Matcher for the exemption patterns of a policy.
+
+    All glob patterns are compiled into one alternation, so checking a resource
+    is a single regex match however many exemptions the policy has.
+    """
+
+    def __init__(self, exemptions: Iterable[Tuple[uuid.UUID, str]]):
+        """
+        Compile the matcher.
+
+        Args:
+            exemptions: Pairs of exemption ID and resource glob pattern
+        """
+        self._exemption_ids: List[uuid.UUID] = []
+        alternatives = []
+        for index, (exemption_id, pattern) in enumerate(exemptions):
+            self._exemption_ids.append(exemption_id)
+            alternatives.append(f"(?P<e{index}>{fnmatch.translate(pattern)})")
+        self._regex = re.compile("|".join(alternatives)) if alternatives else None
+
+    def match(self, resource_identifier: str) -> Optional[uuid.UUID]:
+        """Get the ID of an exemption covering the resource, or None if it is not exempt."""
+        if self._regex is None:
+            return None
+        match = self._regex.match(resource_identifier)
+        if match is None:
+            return None
+        return self._exemption_ids[int(match.lastgroup[1:])]
+
+
+# Compiled exemption matchers by policy ID; entries are dropped when a committed
+# transaction touches one of the policy's exemptions.
+_exemption_matchers = TTLCache(maxsize=1024, ttl=300)
+
+_PENDING_EXEMPTION_CHANGES_KEY = "exemption_matcher_invalidations"
+
+
+# Sample policy data served until policies are read from the database. Each call
+# builds new objects, so callers may modify what they are given.
+def _policy_listing() -> List[Dict[str, Any]]:
+    """Build the placeholder policy listing."""
+    return [
+        {
+            "id": 1,
+            "name": "Require encryption at rest",
+            "description": "All storage resources must have encryption at rest enabled",
+            "policy_type": "security",
+            "severity": "critical",
+            "rules": {
+                "resource_types": ["s3", "ebs", "rds"],
+                "required_settings": {"encryption": True},
+            },
+            "enabled": True,
+            "violation_count": 5,
+            "created_at": "2025-01-01T00:00:00Z",
+            "updated_at": "2025-10-01T00:00:00Z",
+        }
+    ]
+
+
+def _violation_listing() -> List[Dict[str, Any]]:
+    """Build the placeholder violation listing."""
+    return [
+        {
+            "id": 1,
+            "policy_id": 1,
+            "policy_name": "Require encryption at rest",
+            "resource_id": "vol-123456789",
+            "severity": "critical",
+            "description": "EBS volume does not have encryption enabled",
+            "detected_at": "2025-10-20T15:30:00Z",
+            "resolved": False,
+        }
+    ]
+
+
+def _policy_details(policy_id: int) -> Dict[str, Any]:
+    """Build the placeholder details of a policy."""
+    return {
+        "id": policy_id,
+        "name": "Require encryption at rest",
+        "description": "All storage resources must have encryption at rest enabled",
+        "policy_type": "security",
+        "severity": "critical",
+        "rules": {"encryption": True},
+        "enabled": True,
+        "violation_count": 5,
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-10-01T00:00:00Z",
+    }
 
 
 class PolicyService:
@@ -21,45 +152,36 @@ class PolicyService:
     ) -> List[Dict[str, Any]]:
         """List policies with filters."""
         # Placeholder implementation
-        return [
-            {
-                "id": 1,
-                "name": "Require encryption at rest",
-                "description": "All storage resources must have encryption at rest enabled",
-                "policy_type": "security",
-                "severity": "critical",
-                "rules": {
-                    "resource_types": ["s3", "ebs", "rds"],
-                    "required_settings": {"encryption": True},
-                },
-                "enabled": True,
-                "violation_count": 5,
-                "created_at": "2025-01-01T00:00:00Z",
-                "updated_at": "2025-10-01T00:00:00Z",
-            }
-        ]
+        return _policy_listing()
 
     async def get_policy(self, policy_id: int) -> Optional[Dict[str, Any]]:
         """Get a specific policy."""
-        return {
-            "id": policy_id,
-            "name": "Require encryption at rest",
-            "description": "All storage resources must have encryption at rest enabled",
-            "policy_type": "security",
-            "severity": "critical",
-            "rules": {"encryption": True},
-            "enabled": True,
-            "violation_count": 5,
-            "created_at": "2025-01-01T00:00:00Z",
-            "updated_at": "2025-10-01T00:00:00Z",
-        }
+        return _policy_details(policy_id)
+
+    async def get_policy_for_evaluation(self, policy_id: uuid.UUID) -> Optional[Policy]:
+        """Load a policy with its code and other deferred columns."""
+        result = await self.db.execute(POLICY_WITH_BODY_BY_ID, {"policy_id": policy_id})
+        return result.scalar_one_or_none()
+
+    async def get_exemption_matcher(self, policy_id: uuid.UUID) -> ExemptionMatcher:
+        """Get the compiled matcher for a policy's valid exemptions."""
+        matcher = _exemption_matchers.get(policy_id)
+        if matcher is None:
+            result = await self.db.execute(
+                select(PolicyExemption.id, PolicyExemption.resource_pattern).where(
+                    PolicyExemption.policy_id == policy_id, PolicyExemption.is_valid()
+                )
+            )
+            matcher = ExemptionMatcher(result.all())
+            _exemption_matchers.set(policy_id, matcher)
+        return matcher
 
     async def create_policy(self, policy_data: Any) -> Dict[str, Any]:
         """Create a new policy."""
         # Placeholder - would insert into database
         return {
             "id": 999,
-            **policy_data.dict(),
+            **policy_data.model_dump(mode="python"),
             "violation_count": 0,
             "created_at": "2025-10-21T18:00:00Z",
             "updated_at": "2025-10-21T18:00:00Z",
@@ -69,7 +191,7 @@ class PolicyService:
         """Update an existing policy."""
         return {
             "id": policy_id,
-            **policy_data.dict(),
+            **policy_data.model_dump(mode="python"),
             "violation_count": 5,
             "created_at": "2025-01-01T00:00:00Z",
             "updated_at": "2025-10-21T18:00:00Z",
@@ -93,6 +215,40 @@ class PolicyService:
             "low_violations": 1,
         }
 
+    async def find_evaluation_targets(
+        self, resource_id: Optional[uuid.UUID] = None, resource_type: Optional[str] = None
+    ) -> List[Row]:
+        """
+        Pair active policies with the resources they target in a single query.
+
+        Args:
+            resource_id: Only pair policies with this resource
+            resource_type: Only pair policies with resources of this type
+
+        Returns:
+            Rows of (policy_id, resource_id, resource_type, severity)
+        """
+        predicates = []
+        if resource_id:
+            predicates.append(InfrastructureResource.id == resource_id)
+        if resource_type:
+            predicates.append(ResourceType.name == resource_type)
+        result = await self.db.execute(POLICY_TARGETS.where(*predicates))
+        return result.all()
+
+    async def count_evaluation_targets(self) -> Dict[str, int]:
+        """Count policy/resource pairs to evaluate per severity, aggregated in SQL."""
+        targets = POLICY_TARGETS.subquery()
+        result = await self.db.execute(
+            select(targets.c.severity, func.count()).group_by(targets.c.severity)
+        )
+        return {severity.value: count for severity, count in result.tuples().all()}
+
+    async def count_open_violations(self) -> Dict[str, int]:
+        """Count open violations per severity with one GROUP BY query."""
+        counts = await PolicyViolation.count_open_by_severity(self.db)
+        return {f"{severity.value}_violations": count for severity, count in counts.items()}
+
     async def list_violations(
         self,
         policy_id: Optional[int] = None,
@@ -102,21 +258,32 @@ class PolicyService:
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
         """List policy violations."""
-        return [
-            {
-                "id": 1,
-                "policy_id": 1,
-                "policy_name": "Require encryption at rest",
-                "resource_id": "vol-123456789",
-                "severity": "critical",
-                "description": "EBS volume does not have encryption enabled",
-                "detected_at": "2025-10-20T15:30:00Z",
-                "resolved": False,
-            }
-        ]
+        return _violation_listing()
 
     async def resolve_violation(
         self, violation_id: int, resolution_notes: Optional[str] = None
     ) -> bool:
         """Mark a violation as resolved."""
         return True
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_exemption_changes(session: Session, flush_context: Any) -> None:
+    """Remember policies whose exemptions were written in this transaction."""
+    pending = session.info.setdefault(_PENDING_EXEMPTION_CHANGES_KEY, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, PolicyExemption):
+            pending.add(obj.policy_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_exemption_matchers(session: Session) -> None:
+    """Drop compiled matchers for policies whose exemptions were committed."""
+    for policy_id in session.info.pop(_PENDING_EXEMPTION_CHANGES_KEY, ()):
+        _exemption_matchers.invalidate(policy_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_exemption_changes(session: Session) -> None:
+    """Forget pending matcher invalidations when the transaction is rolled back."""
+    session.info.pop(_PENDING_EXEMPTION_CHANGES_KEY, None)
@@ -1,8 +1,59 @@
 """User management service layer."""
 
+import uuid
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
+
+from app.models.users import User, UserRole
+
+# Loads a user together with everything permission checks traverse, in two
+# queries. Any other relationship access raises instead of lazy loading.
+USER_WITH_ROLES = select(User).options(
+    selectinload(User.user_roles).joinedload(UserRole.role),
+    raiseload("*"),
+)
+USER_WITH_ROLES_BY_ID = USER_WITH_ROLES.where(User.id == bindparam("user_id"))
+
+
+# Seed administrator returned by the placeholder lookups
+_ADMIN_USER_ID = 1
+_ADMIN_USERNAME = "admin"
+_ADMIN_EMAIL = "admin@cloudops.example.com"
+
+
+def _user_details(user_id: int) -> Dict[str, Any]:
+    """Build the placeholder details of a user; each call returns a new dict."""
+    return {
+        "id": user_id,
+        "username": _ADMIN_USERNAME,
+        "email": _ADMIN_EMAIL,
+        "full_name": "System Administrator",
+        "is_active": True,
+        "role": "admin",
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+
+
+def _user_permissions(user_id: int) -> Dict[str, Any]:
+    """Build the placeholder permission summary of a user."""
+    return {
+        "user_id": user_id,
+        "role": "admin",
+        "permissions": [
+            "infrastructure:read",
+            "infrastructure:write",
+            "costs:read",
+            "costs:write",
+            "policies:read",
+            "policies:write",
+            "users:read",
+            "users:write",
+        ],
+        "cloud_provider_access": ["aws", "azure", "gcp"],
+    }
 
 
 class UserService:
@@ -20,56 +71,27 @@ class UserService:
     ) -> List[Dict[str, Any]]:
         """List users with filters."""
         # Placeholder implementation
-        return [
-            {
-                "id": 1,
-                "username": "admin",
-                "email": "admin@cloudops.example.com",
-                "full_name": "System Administrator",
-                "is_active": True,
-                "role": "admin",
-                "created_at": "2025-01-01T00:00:00Z",
-            }
-        ]
+        return [_user_details(_ADMIN_USER_ID)]
 
     async def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get a specific user."""
-        return {
-            "id": user_id,
-            "username": "admin",
-            "email": "admin@cloudops.example.com",
-            "full_name": "System Administrator",
-            "is_active": True,
-            "role": "admin",
-            "created_at": "2025-01-01T00:00:00Z",
-        }
+        return _user_details(user_id)
+
+    async def get_user_with_roles(self, user_id: uuid.UUID) -> Optional[User]:
+        """Load a user with roles eagerly loaded for permission checks."""
+        result = await self.db.execute(USER_WITH_ROLES_BY_ID, {"user_id": user_id})
+        return result.scalar_one_or_none()
 
     async def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
         """Get user by username."""
-        if username == "admin":
-            return {
-                "id": 1,
-                "username": username,
-                "email": "admin@cloudops.example.com",
-                "full_name": "System Administrator",
-                "is_active": True,
-                "role": "admin",
-                "created_at": "2025-01-01T00:00:00Z",
-            }
+        if username == _ADMIN_USERNAME:
+            return _user_details(_ADMIN_USER_ID)
         return None
 
     async def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get user by email."""
-        if email == "admin@cloudops.example.com":
-            return {
-                "id": 1,
-                "username": "admin",
-                "email": email,
-                "full_name": "System Administrator",
-                "is_active": True,
-                "role": "admin",
-                "created_at": "2025-01-01T00:00:00Z",
-            }
+        if email == _ADMIN_EMAIL:
+            return _user_details(_ADMIN_USER_ID)
         return None
 
     async def create_user(self, user_data: Any) -> Dict[str, Any]:
@@ -87,7 +109,8 @@ class UserService:
 
     async def update_user(self, user_id: int, user_data: Any) -> Optional[Dict[str, Any]]:
         """Update an existing user."""
-        update_dict = user_data.dict(exclude_unset=True)
+        # Only the few fields the client sent are read, without a full model dump
+        update_dict = {field: getattr(user_data, field) for field in user_data.model_fields_set}
         return {
             "id": user_id,
             "username": "admin",
@@ -101,18 +124,4 @@ class UserService:
 
     async def get_user_permissions(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user permissions."""
-        return {
-            "user_id": user_id,
-            "role": "admin",
-            "permissions": [
-                "infrastructure:read",
-                "infrastructure:write",
-                "costs:read",
-                "costs:write",
-                "policies:read",
-                "policies:write",
-                "users:read",
-                "users:write",
-            ],
-            "cloud_provider_access": ["aws", "azure", "gcp"],
-        }
+        return _user_permissions(user_id)
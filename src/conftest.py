@@ -11,28 +11,44 @@ This module provides shared fixtures for all test types including:
 
 import asyncio
 import os
-from typing import AsyncGenerator, Generator
+import sys
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any, AsyncGenerator, AsyncIterator, Generator, Mapping
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
-from sqlalchemy import create_engine
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import INET, JSONB, UUID
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+from starlette.routing import Mount
 
 from app.core.config import Settings, get_settings
-from app.core.database import Base, get_db
-from app.models.costs import CostRecord
-from app.models.infrastructure import CloudProvider, InfrastructureResource
-from app.models.policies import Policy
-from app.models.users import Role, User, UserStatus
+from app.core.database import get_db
+from app.core.exceptions import AuthenticationError
+from app.core.middleware import AuthenticationMiddleware
+from app.models import Base
 
 # Import the app and dependencies
 from main import app
 
+if TYPE_CHECKING:
+    from app.models.costs import CostRecord
+    from app.models.infrastructure import CloudProvider, InfrastructureResource, ResourceType
+    from app.models.policies import Policy
+    from app.models.users import User, UserStatus
+
 # ============================================
 # Test Configuration
 # ============================================
@@ -51,10 +67,59 @@ def get_test_settings() -> Settings:
     )
 
 
+def _worker_database_url(url: str) -> str:
+    """
+    Give each pytest-xdist worker its own SQLite database file.
+
+    In-memory databases are already private to the worker process; other
+    backends are returned unchanged.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    parsed = make_url(url)
+    if not worker or parsed.get_backend_name() != "sqlite":
+        return url
+    if not parsed.database or parsed.database == ":memory:":
+        return url
+    root, ext = os.path.splitext(parsed.database)
+    return parsed.set(database=f"{root}_{worker}{ext}").render_as_string(hide_password=False)
+
+
+# Point at a file-backed database (e.g. sqlite+aiosqlite:///./test.db) to debug
+# a failing test's data after the run.
+TEST_DATABASE_URL = _worker_database_url(
+    os.environ.get("TEST_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+)
+
 # Override the settings dependency
 app.dependency_overrides[get_settings] = get_test_settings
 
 
+@asynccontextmanager
+async def _test_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Skip the production startup work; test_db_engine already builds the schema."""
+    yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def skip_app_lifespan() -> Generator[None, None, None]:
+    """Run test clients without the app's monitoring setup and production engine DDL."""
+    lifespan_context = app.router.lifespan_context
+    app.router.lifespan_context = _test_lifespan
+    yield
+    app.router.lifespan_context = lifespan_context
+
+
+@pytest.fixture(scope="session", autouse=True)
+def skip_static_mount() -> Generator[None, None, None]:
+    """Route test requests past the static files mount, which no test serves from."""
+    routes = app.router.routes
+    app.router.routes = [
+        route for route in routes if not (isinstance(route, Mount) and route.name == "static")
+    ]
+    yield
+    app.router.routes = routes
+
+
 # ============================================
 # Database Fixtures
 # ============================================
@@ -62,21 +127,69 @@ app.dependency_overrides[get_settings] = get_test_settings
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    """Create the event loop for the test session, using uvloop where available."""
+    # Build the loop directly rather than installing uvloop's policy, which would
+    # stay in effect for the rest of the process.
+    if sys.platform != "win32":
+        import uvloop
+
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
     yield loop
     loop.close()
 
 
-@pytest_asyncio.fixture(scope="function")
+def _test_engine_pool_args(url: str) -> dict:
+    """Choose the connection pool for the test engine's database URL."""
+    if ":memory:" in url:
+        # One shared connection on purpose: each test runs inside an outer transaction
+        # on it, and a shared-cache memory database would only add table-level lock
+        # errors for other connections (WAL is not available for memory databases).
+        return {"connect_args": {"check_same_thread": False}, "poolclass": StaticPool}
+    # File-backed databases can pool connections; the async-adapted pool is required
+    # because the plain QueuePool blocks the event loop when it runs out.
+    return {"poolclass": AsyncAdaptedQueuePool, "pool_size": 25, "max_overflow": 0}
+
+
+# The models use PostgreSQL column types; give SQLite equivalents so the schema
+# can be created there. UUID values are bound as 32-character hex strings.
+@compiles(UUID, "sqlite")
+def _compile_uuid_sqlite(type_, compiler, **kw) -> str:
+    return "CHAR(32)"
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw) -> str:
+    return "JSON"
+
+
+@compiles(INET, "sqlite")
+def _compile_inet_sqlite(type_, compiler, **kw) -> str:
+    return "VARCHAR(45)"
+
+
+@pytest_asyncio.fixture(scope="session")
 async def test_db_engine():
-    """Create a test database engine."""
+    """Create a test database engine and schema once for the whole session."""
+    # The whole suite shares one engine, so size its compiled-statement cache above
+    # the default 500 to keep early statements from being evicted and recompiled.
     engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+        TEST_DATABASE_URL,
+        query_cache_size=1200,
+        **_test_engine_pool_args(TEST_DATABASE_URL),
     )
 
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINTs; let SQLAlchemy
+    # emit BEGIN so the per-test rollback below really undoes committed work.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -90,15 +203,25 @@ async def test_db_engine():
 
 @pytest_asyncio.fixture(scope="function")
 async def test_db_session(test_db_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    async_session_maker = async_sessionmaker(
-        test_db_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    """
+    Create a test database session isolated in a transaction.
+
+    The session joins an outer transaction that is rolled back after the test;
+    commits inside the test only release a SAVEPOINT, so nothing persists.
+    """
+    async with test_db_engine.connect() as connection:
+        transaction = await connection.begin()
+        async_session_maker = async_sessionmaker(
+            bind=connection,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        async with async_session_maker() as session:
+            yield session
 
-    async with async_session_maker() as session:
-        yield session
+        await transaction.rollback()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -120,17 +243,102 @@ async def db_session(
 # ============================================
 
 
-@pytest.fixture(scope="function")
-def client() -> Generator[TestClient, None, None]:
+# The clients are shared across the session so the app's lifespan runs once;
+# the per-test database is injected through the get_db override in db_session.
+
+
+# The app has no token service yet, so API tests authenticate with fixed bearer
+# tokens (see auth_headers/admin_auth_headers) resolved to these users.
+_TEST_TOKEN_USERS = MappingProxyType(
+    {
+        "test-token": MappingProxyType(
+            {"user_id": "test-user-id", "email": "test@example.com", "roles": ("user",)}
+        ),
+        "admin-test-token": MappingProxyType(
+            {"user_id": "admin-user-id", "email": "admin@example.com", "roles": ("admin",)}
+        ),
+    }
+)
+
+
+class _FixedTokenAuthenticationMiddleware(AuthenticationMiddleware):
+    """Authentication middleware that accepts the fixed test tokens."""
+
+    async def _validate_token(self, token: str) -> dict:
+        user = _TEST_TOKEN_USERS.get(token)
+        if user is None:
+            raise AuthenticationError("Invalid authentication token")
+        return dict(user)
+
+
+def build_test_app() -> FastAPI:
+    """
+    Build an app serving the main app's routes with only the middleware API tests exercise.
+
+    Routes, exception handlers and app-level dependencies come from the main app,
+    and routes still resolve dependency overrides through it. Logging, rate
+    limiting, session and security-header middleware are left out; use
+    full_stack_client to test those.
+    """
+    test_app = FastAPI(lifespan=_test_lifespan, default_response_class=ORJSONResponse)
+    test_app.router.routes = [
+        route for route in app.routes if not (isinstance(route, Mount) and route.name == "static")
+    ]
+    test_app.exception_handlers.update(app.exception_handlers)
+
+    settings = get_settings()
+    test_app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.BACKEND_CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    test_app.add_middleware(_FixedTokenAuthenticationMiddleware)
+    return test_app
+
+
+@pytest.fixture(scope="session")
+def test_app() -> FastAPI:
+    """App under test for API tests, without the full middleware stack."""
+    return build_test_app()
+
+
+@pytest.fixture(scope="session")
+def client(test_app: FastAPI) -> Generator[TestClient, None, None]:
     """Create a synchronous test client."""
-    with TestClient(app) as test_client:
+    with TestClient(test_app) as test_client:
         yield test_client
 
 
-@pytest_asyncio.fixture(scope="function")
-async def async_client() -> AsyncGenerator[AsyncClient, None]:
+@pytest_asyncio.fixture(scope="session")
+async def async_client(test_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
     """Create an asynchronous test client."""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    transport = ASGITransport(app=test_app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="session")
+async def authenticated_client(
+    test_app: FastAPI, auth_headers: Mapping
+) -> AsyncGenerator[AsyncClient, None]:
+    """Create an asynchronous test client that sends the test user's bearer token."""
+    transport = ASGITransport(app=test_app, raise_app_exceptions=False)
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        headers={"Authorization": auth_headers["Authorization"]},
+    ) as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="session")
+async def full_stack_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create an asynchronous test client for the main app with all of its middleware."""
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    # TrustedHostMiddleware rejects hosts outside ALLOWED_HOSTS, so use one it accepts.
+    async with AsyncClient(transport=transport, base_url="http://localhost") as ac:
         yield ac
 
 
@@ -139,74 +347,102 @@ async def async_client() -> AsyncGenerator[AsyncClient, None]:
 # ============================================
 
 
-@pytest.fixture
-def test_user_data() -> dict:
-    """Test user data."""
-    return {
-        "email": "test@example.com",
-        "username": "testuser",
-        "first_name": "Test",
-        "last_name": "User",
-        "hashed_password": "hashed_password_placeholder",
-        "user_status": UserStatus.ACTIVE,
-        "is_superuser": False,
-        "is_verified": True,
-    }
+@dataclass(frozen=True, slots=True)
+class UserSeed:
+    """Column values for a test user, built once per session."""
 
+    email: str
+    username: str
+    first_name: str
+    last_name: str
+    hashed_password: str
+    user_status: "UserStatus"
+    is_superuser: bool = False
+    is_verified: bool = True
 
-@pytest.fixture
-def test_admin_data() -> dict:
-    """Test admin user data."""
-    return {
-        "email": "admin@example.com",
-        "username": "admin",
-        "first_name": "Admin",
-        "last_name": "User",
-        "hashed_password": "hashed_admin_password",
-        "user_status": UserStatus.ACTIVE,
-        "is_superuser": True,
-        "is_verified": True,
-    }
+
+@pytest.fixture(scope="session")
+def test_user_data() -> Mapping:
+    """Test user data, shared read-only across the session."""
+    from app.models.users import UserStatus
+
+    seed = UserSeed(
+        email="test@example.com",
+        username="testuser",
+        first_name="Test",
+        last_name="User",
+        hashed_password="hashed_password_placeholder",
+        user_status=UserStatus.ACTIVE,
+    )
+    return MappingProxyType(asdict(seed))
+
+
+@pytest.fixture(scope="session")
+def test_admin_data() -> Mapping:
+    """Test admin user data, shared read-only across the session."""
+    from app.models.users import UserStatus
+
+    seed = UserSeed(
+        email="admin@example.com",
+        username="admin",
+        first_name="Admin",
+        last_name="User",
+        hashed_password="hashed_admin_password",
+        user_status=UserStatus.ACTIVE,
+        is_superuser=True,
+    )
+    return MappingProxyType(asdict(seed))
 
 
 @pytest_asyncio.fixture
-async def test_user(db_session: AsyncSession, test_user_data: dict) -> User:
+async def test_user(db_session: AsyncSession, test_user_data: Mapping) -> "User":
     """Create a test user in the database."""
+    from app.models.users import User
+
     user = User(**test_user_data)
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
     return user
 
 
 @pytest_asyncio.fixture
-async def test_admin(db_session: AsyncSession, test_admin_data: dict) -> User:
+async def test_admin(db_session: AsyncSession, test_admin_data: Mapping) -> "User":
     """Create a test admin user in the database."""
+    from app.models.users import User
+
     admin = User(**test_admin_data)
     db_session.add(admin)
-    await db_session.commit()
-    await db_session.refresh(admin)
+    await db_session.flush()
     return admin
 
 
-@pytest.fixture
-def auth_headers(test_user_data: dict) -> dict:
-    """Create authentication headers with JWT token."""
-    # In a real scenario, generate a proper JWT token
-    # For now, we'll use a mock token
-    return {
+# In a real scenario, generate a proper JWT token
+# For now, we'll use mock tokens
+_AUTH_HEADERS = MappingProxyType(
+    {
         "Authorization": "Bearer test-token",
         "Content-Type": "application/json",
     }
+)
 
-
-@pytest.fixture
-def admin_auth_headers(test_admin_data: dict) -> dict:
-    """Create admin authentication headers with JWT token."""
-    return {
+_ADMIN_AUTH_HEADERS = MappingProxyType(
+    {
         "Authorization": "Bearer admin-test-token",
         "Content-Type": "application/json",
     }
+)
+
+
+@pytest.fixture(scope="session")
+def auth_headers(test_user_data: Mapping) -> Mapping:
+    """Create authentication headers with JWT token."""
+    return _AUTH_HEADERS
+
+
+@pytest.fixture(scope="session")
+def admin_auth_headers(test_admin_data: Mapping) -> Mapping:
+    """Create admin authentication headers with JWT token."""
+    return _ADMIN_AUTH_HEADERS
 
 
 # ============================================
@@ -214,70 +450,53 @@ def admin_auth_headers(test_admin_data: dict) -> dict:
 # ============================================
 
 
-@pytest_asyncio.fixture
-async def test_cloud_provider(db_session: AsyncSession) -> CloudProvider:
-    """Create a test cloud provider."""
-    provider = CloudProvider(
+def build_cloud_provider() -> "CloudProvider":
+    """Build an unsaved test cloud provider."""
+    from app.models.infrastructure import CloudProvider
+
+    return CloudProvider(
         name="AWS",
         provider_type="aws",
         description="Amazon Web Services",
-        is_enabled=True,
+        is_active=True,
         configuration={"region": "us-east-1"},
     )
-    db_session.add(provider)
-    await db_session.commit()
-    await db_session.refresh(provider)
-    return provider
 
 
-@pytest_asyncio.fixture
-async def test_resource_type(db_session: AsyncSession) -> "ResourceType":
-    """Create a test resource type."""
-    from app.models.infrastructure import ResourceType
+def build_resource_type() -> "ResourceType":
+    """Build an unsaved test resource type."""
+    from app.models.infrastructure import CloudProviderType, ResourceType
 
-    resource_type = ResourceType(
+    return ResourceType(
         name="EC2 Instance",
         resource_category="compute",
-        cloud_provider_type="aws",
-        icon="server",
+        provider_type=CloudProviderType.AWS,
     )
-    db_session.add(resource_type)
-    await db_session.commit()
-    await db_session.refresh(resource_type)
-    return resource_type
 
 
-@pytest_asyncio.fixture
-async def test_infrastructure_resource(
-    db_session: AsyncSession,
-    test_cloud_provider: CloudProvider,
-    test_resource_type: "ResourceType",
-) -> InfrastructureResource:
-    """Create a test infrastructure resource."""
-    from app.models.infrastructure import ResourceStatus
+def build_infrastructure_resource(
+    cloud_provider: "CloudProvider", resource_type: "ResourceType"
+) -> "InfrastructureResource":
+    """Build an unsaved test infrastructure resource linked to its provider and type."""
+    from app.models.infrastructure import InfrastructureResource, ResourceStatus
 
-    resource = InfrastructureResource(
+    return InfrastructureResource(
         name="test-instance",
         description="Test EC2 instance",
-        cloud_provider_id=test_cloud_provider.id,
-        resource_type_id=test_resource_type.id,
+        cloud_provider=cloud_provider,
+        resource_type=resource_type,
         external_id="i-1234567890abcdef0",
         region="us-east-1",
         resource_status=ResourceStatus.RUNNING,
-        configuration={"instance_type": "t3.medium"},
+        desired_configuration={"instance_type": "t3.medium"},
     )
-    db_session.add(resource)
-    await db_session.commit()
-    await db_session.refresh(resource)
-    return resource
 
 
-@pytest_asyncio.fixture
-async def test_policy(db_session: AsyncSession) -> Policy:
-    """Create a test policy."""
-    from app.models.policies import PolicySeverity, PolicyType, RuleEngine
+def build_policy() -> "Policy":
+    """Build an unsaved test policy."""
+    from app.models.policies import Policy, PolicySeverity, PolicyType, RuleEngine
 
-    policy = Policy(
+    return Policy(
         name="Test Security Policy",
         description="A test policy for security compliance",
         policy_type=PolicyType.SECURITY,
@@ -286,42 +505,142 @@ async def test_policy(db_session: AsyncSession) -> Policy:
         rule_engine=RuleEngine.OPA,
         target_resources=["ec2_instance", "rds_instance"],
     )
-    db_session.add(policy)
-    await db_session.commit()
-    await db_session.refresh(policy)
-    return policy
 
 
-@pytest_asyncio.fixture
-async def test_cost_record(
-    db_session: AsyncSession,
-    test_infrastructure_resource: InfrastructureResource,
-    test_cloud_provider: CloudProvider,
-) -> CostRecord:
-    """Create a test cost record."""
+def build_cost_record(
+    resource: "InfrastructureResource", cloud_provider: "CloudProvider"
+) -> "CostRecord":
+    """Build an unsaved test cost record for a resource."""
     from datetime import datetime, timedelta
-    from decimal import Decimal
+
+    from app.models.costs import CostRecord
 
     now = datetime.utcnow()
-    cost = CostRecord(
-        resource_id=test_infrastructure_resource.id,
-        cloud_provider_id=test_cloud_provider.id,
+    return CostRecord(
+        resource=resource,
+        cloud_provider=cloud_provider,
         service_name="EC2",
         resource_type="Instance",
         resource_identifier="i-1234567890abcdef0",
         region="us-east-1",
-        cost_amount=Decimal("125.50"),
+        cost_amount_micros=125_500_000,
         currency="USD",
         billing_period_start=now - timedelta(days=1),
         billing_period_end=now,
         cost_details={},
     )
+
+
+# Fixed primary keys of the canonical rows seeded once per session
+SEED_IDS = SimpleNamespace(
+    cloud_provider_id=uuid.UUID("00000000-0000-4000-8000-000000000001"),
+    resource_type_id=uuid.UUID("00000000-0000-4000-8000-000000000002"),
+    resource_id=uuid.UUID("00000000-0000-4000-8000-000000000003"),
+    policy_id=uuid.UUID("00000000-0000-4000-8000-000000000004"),
+)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def seeded_ids(test_db_engine) -> SimpleNamespace:
+    """
+    Insert the canonical provider, resource type, resource and policy once.
+
+    The rows are committed outside any test's transaction, so every test sees
+    them and per-test rollbacks leave them in place. Tests must not modify or
+    delete them.
+    """
+    provider = build_cloud_provider()
+    provider.id = SEED_IDS.cloud_provider_id
+    resource_type = build_resource_type()
+    resource_type.id = SEED_IDS.resource_type_id
+    resource = build_infrastructure_resource(provider, resource_type)
+    resource.id = SEED_IDS.resource_id
+    policy = build_policy()
+    policy.id = SEED_IDS.policy_id
+
+    async with AsyncSession(test_db_engine, expire_on_commit=False) as session:
+        session.add_all([provider, resource_type, resource, policy])
+        await session.commit()
+    return SEED_IDS
+
+
+@pytest_asyncio.fixture
+async def test_cloud_provider(db_session: AsyncSession, seeded_ids) -> "CloudProvider":
+    """Get the seeded test cloud provider."""
+    from app.models.infrastructure import CloudProvider
+
+    return await db_session.get(CloudProvider, seeded_ids.cloud_provider_id)
+
+
+@pytest_asyncio.fixture
+async def test_resource_type(db_session: AsyncSession, seeded_ids) -> "ResourceType":
+    """Get the seeded test resource type."""
+    from app.models.infrastructure import ResourceType
+
+    return await db_session.get(ResourceType, seeded_ids.resource_type_id)
+
+
+@pytest_asyncio.fixture
+async def test_infrastructure_resource(
+    db_session: AsyncSession, seeded_ids
+) -> "InfrastructureResource":
+    """Get the seeded test infrastructure resource."""
+    from app.models.infrastructure import InfrastructureResource
+
+    return await db_session.get(InfrastructureResource, seeded_ids.resource_id)
+
+
+@pytest_asyncio.fixture
+async def test_policy(db_session: AsyncSession, seeded_ids) -> "Policy":
+    """Get the seeded test policy."""
+    from app.models.policies import Policy
+
+    return await db_session.get(Policy, seeded_ids.policy_id)
+
+
+@pytest_asyncio.fixture
+async def test_cost_record(
+    db_session: AsyncSession,
+    test_infrastructure_resource: "InfrastructureResource",
+    test_cloud_provider: "CloudProvider",
+) -> "CostRecord":
+    """Create a test cost record."""
+    cost = build_cost_record(test_infrastructure_resource, test_cloud_provider)
     db_session.add(cost)
-    await db_session.commit()
-    await db_session.refresh(cost)
+    await db_session.flush()
     return cost
 
 
+@pytest_asyncio.fixture
+async def seed_graph(
+    db_session: AsyncSession,
+    test_user_data: Mapping,
+    test_cloud_provider: "CloudProvider",
+    test_resource_type: "ResourceType",
+    test_infrastructure_resource: "InfrastructureResource",
+    test_policy: "Policy",
+) -> SimpleNamespace:
+    """
+    Create a user and a cost record on top of the seeded provider, resource and policy.
+
+    The new rows are written with a single flush. Nothing is committed; the
+    per-test rollback discards them.
+    """
+    from app.models.users import User
+
+    graph = SimpleNamespace(
+        user=User(**test_user_data),
+        cloud_provider=test_cloud_provider,
+        resource_type=test_resource_type,
+        resource=test_infrastructure_resource,
+        policy=test_policy,
+        cost_record=build_cost_record(test_infrastructure_resource, test_cloud_provider),
+    )
+    db_session.add_all([graph.user, graph.cost_record])
+    await db_session.flush()
+    return graph
+
+
 # ============================================
 # Mock Cloud Provider Fixtures
 # ============================================
@@ -366,9 +685,41 @@ def mock_gcp_client():
 # ============================================
 
 
+class FakeRedis:
+    """
+    Dict-backed stand-in for the async Redis client's basic key commands.
+
+    Unlike an AsyncMock it keeps no call history and behaves like a real store:
+    a value written with ``set`` is returned by a later ``get``. Expiry options
+    are accepted and ignored.
+    """
+
+    def __init__(self) -> None:
+        self._data: dict = {}
+
+    async def get(self, name: str) -> Any:
+        return self._data.get(name)
+
+    async def set(self, name: str, value: Any, **kwargs: Any) -> bool:
+        self._data[name] = value
+        return True
+
+    async def delete(self, *names: str) -> int:
+        return sum(self._data.pop(name, None) is not None for name in names)
+
+    async def exists(self, *names: str) -> int:
+        return sum(name in self._data for name in names)
+
+
+@pytest.fixture
+def mock_redis() -> FakeRedis:
+    """In-memory fake Redis client."""
+    return FakeRedis()
+
+
 @pytest.fixture
-def mock_redis():
-    """Mock Redis client."""
+def mock_redis_strict() -> AsyncMock:
+    """Mock Redis client for tests that assert on the calls made to it."""
     mock = AsyncMock()
     mock.get.return_value = None
     mock.set.return_value = True
@@ -382,16 +733,18 @@ def mock_redis():
 # ============================================
 
 
-@pytest.fixture(scope="function", autouse=True)
-def test_env_vars():
-    """Set test environment variables."""
-    os.environ["ENVIRONMENT"] = "testing"
-    os.environ["DEBUG"] = "true"
-    os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
-    yield
-    # Cleanup
-    for key in ["ENVIRONMENT", "DEBUG", "DATABASE_URL"]:
-        os.environ.pop(key, None)
+@pytest.fixture(scope="session", autouse=True)
+def test_env_vars() -> Generator[None, None, None]:
+    """Set test environment variables once for the session and restore them afterwards."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ENVIRONMENT", "testing")
+        mp.setenv("DEBUG", "true")
+        mp.setenv("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+        # Settings cached at import predate these variables; reload them once and keep warm
+        get_settings.cache_clear()
+        get_settings()
+        yield
+    get_settings.cache_clear()
 
 
 # ============================================
@@ -399,36 +752,32 @@ def test_env_vars():
 # ============================================
 
 
-@pytest.fixture
-def sample_api_response() -> dict:
-    """Sample API response for testing."""
-    return {
+_SAMPLE_API_RESPONSE = MappingProxyType(
+    {
         "status": "success",
         "data": {"id": 1, "name": "test"},
         "message": "Operation completed successfully",
     }
+)
 
-
-@pytest.fixture
-def sample_error_response() -> dict:
-    """Sample error response for testing."""
-    return {
+_SAMPLE_ERROR_RESPONSE = MappingProxyType(
+    {
         "error": {
             "type": "validation_error",
             "message": "Invalid input data",
             "details": {"field": "value"},
         }
     }
+)
 
 
-# ============================================
-# Cleanup Fixtures
-# ============================================
+@pytest.fixture(scope="session")
+def sample_api_response() -> Mapping:
+    """Sample API response for testing."""
+    return _SAMPLE_API_RESPONSE
 
 
-@pytest.fixture(scope="function", autouse=True)
-async def cleanup_after_test(db_session: AsyncSession):
-    """Cleanup database after each test."""
-    yield
-    # Rollback any uncommitted changes
-    await db_session.rollback()
+@pytest.fixture(scope="session")
+def sample_error_response() -> Mapping:
+    """Sample error response for testing."""
+    return _SAMPLE_ERROR_RESPONSE
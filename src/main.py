@@ -9,14 +9,15 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import uvicorn
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.api.router import api_router
+from app.core.clock import pin_request_now
 from app.core.config import get_settings
 from app.core.database import engine
 from app.core.exceptions import CloudOpsException
@@ -73,6 +74,8 @@ app = FastAPI(
     redoc_url=f"{settings.API_V1_STR}/redoc",
     lifespan=lifespan,
     debug=settings.DEBUG,
+    dependencies=[Depends(pin_request_now)],
+    default_response_class=ORJSONResponse,
 )
 
 # Add middleware
@@ -2,14 +2,18 @@
 End-to-end tests for infrastructure management workflows.
 """
 
+import asyncio
+
 import pytest
 from fastapi import status
 
+# Long-running workflows share one xdist worker so they don't starve the fast tests
+pytestmark = pytest.mark.xdist_group("e2e")
+
 
 class TestInfrastructureDiscoveryWorkflow:
     """Test complete infrastructure discovery workflow."""
 
-    @pytest.mark.asyncio
     @pytest.mark.e2e
     @pytest.mark.slow
     async def test_complete_infrastructure_sync_workflow(self, async_client, db_session):
@@ -29,29 +33,35 @@ class TestInfrastructureDiscoveryWorkflow:
         sync_data = sync_response.json()
         assert sync_data["discovered"] > 0
 
+        # Steps 2 and 5 only read, so list resources and fetch statistics together
+        list_response, stats_response = await asyncio.gather(
+            async_client.get("/api/v1/infrastructure/resources"),
+            async_client.get("/api/v1/infrastructure/statistics"),
+        )
+
         # Step 2: List resources
-        list_response = await async_client.get("/api/v1/infrastructure/resources")
         assert list_response.status_code == status.HTTP_200_OK
         resources = list_response.json()
         assert len(resources) > 0
 
-        # Step 3: Get specific resource
+        # Steps 3 and 4 depend on a listed resource but not on each other
         resource_id = resources[0]["resource_id"]
-        detail_response = await async_client.get(f"/api/v1/infrastructure/resources/{resource_id}")
+        detail_response, drift_response = await asyncio.gather(
+            async_client.get(f"/api/v1/infrastructure/resources/{resource_id}"),
+            async_client.get(f"/api/v1/infrastructure/resources/{resource_id}/drift"),
+        )
+
+        # Step 3: Get specific resource
         assert detail_response.status_code == status.HTTP_200_OK
         resource_detail = detail_response.json()
         assert resource_detail["resource_id"] == resource_id
 
         # Step 4: Check drift
-        drift_response = await async_client.get(
-            f"/api/v1/infrastructure/resources/{resource_id}/drift"
-        )
         assert drift_response.status_code == status.HTTP_200_OK
         drift_data = drift_response.json()
         assert "drift_detected" in drift_data
 
         # Step 5: View statistics
-        stats_response = await async_client.get("/api/v1/infrastructure/statistics")
         assert stats_response.status_code == status.HTTP_200_OK
         stats = stats_response.json()
         assert stats["total_resources"] > 0
@@ -60,7 +70,6 @@ class TestInfrastructureDiscoveryWorkflow:
 class TestInfrastructureFilteringWorkflow:
     """Test infrastructure filtering and search workflow."""
 
-    @pytest.mark.asyncio
     @pytest.mark.e2e
     async def test_filter_by_provider_and_type(self, async_client, db_session):
         """
@@ -90,7 +99,6 @@ class TestInfrastructureFilteringWorkflow:
 class TestCostOptimizationWorkflow:
     """Test complete cost optimization workflow."""
 
-    @pytest.mark.asyncio
     @pytest.mark.e2e
     @pytest.mark.slow
     async def test_cost_analysis_and_optimization(self, async_client, db_session):
@@ -102,37 +110,47 @@ class TestCostOptimizationWorkflow:
         4. Get forecast
         5. Get optimization recommendations
         """
+        # Every step only reads, so issue all requests at once
+        (
+            current_response,
+            breakdown_response,
+            anomalies_response,
+            forecast_response,
+            recommendations_response,
+        ) = await asyncio.gather(
+            async_client.get("/api/v1/costs/current"),
+            async_client.get(
+                "/api/v1/costs/breakdown",
+                params={
+                    "start_date": "2025-11-01",
+                    "end_date": "2025-11-30",
+                    "group_by": "service",
+                },
+            ),
+            async_client.get("/api/v1/costs/anomalies"),
+            async_client.get("/api/v1/costs/forecast", params={"days": 30}),
+            async_client.get("/api/v1/costs/recommendations"),
+        )
+
         # Step 1: Current costs
-        current_response = await async_client.get("/api/v1/costs/current")
         assert current_response.status_code == status.HTTP_200_OK
         current_data = current_response.json()
         assert "total_cost" in current_data
 
         # Step 2: Cost breakdown
-        breakdown_response = await async_client.get(
-            "/api/v1/costs/breakdown",
-            params={
-                "start_date": "2025-11-01",
-                "end_date": "2025-11-30",
-                "group_by": "service",
-            },
-        )
         assert breakdown_response.status_code == status.HTTP_200_OK
 
         # Step 3: Detect anomalies
-        anomalies_response = await async_client.get("/api/v1/costs/anomalies")
         assert anomalies_response.status_code == status.HTTP_200_OK
         anomalies = anomalies_response.json()
         assert isinstance(anomalies, list)
 
         # Step 4: Get forecast
-        forecast_response = await async_client.get("/api/v1/costs/forecast", params={"days": 30})
         assert forecast_response.status_code == status.HTTP_200_OK
         forecast = forecast_response.json()
         assert "forecasted_cost" in forecast
 
         # Step 5: Get recommendations
-        recommendations_response = await async_client.get("/api/v1/costs/recommendations")
         assert recommendations_response.status_code == status.HTTP_200_OK
         recommendations = recommendations_response.json()
         assert isinstance(recommendations, list)
@@ -141,7 +159,6 @@ class TestCostOptimizationWorkflow:
 class TestPolicyComplianceWorkflow:
     """Test complete policy compliance workflow."""
 
-    @pytest.mark.asyncio
     @pytest.mark.e2e
     async def test_policy_lifecycle(self, async_client, db_session):
         """
@@ -207,7 +224,6 @@ class TestPolicyComplianceWorkflow:
 class TestHealthAndMonitoring:
     """Test health check and monitoring endpoints."""
 
-    @pytest.mark.asyncio
     @pytest.mark.e2e
     async def test_health_endpoints(self, async_client):
         """Test all health and status endpoints."""
@@ -0,0 +1,55 @@
+"""
+Request payload helpers that derive test bodies from the app's OpenAPI schema.
+"""
+
+from typing import Any, Dict
+
+from fastapi import FastAPI
+
+# Placeholder value for each JSON schema type a required field can have
+_SAMPLE_VALUES: Dict[str, Any] = {
+    "string": "test",
+    "integer": 1,
+    "number": 1.0,
+    "boolean": True,
+    "object": {},
+    "array": [],
+}
+
+
+def request_schema(app: FastAPI, path: str, method: str) -> Dict[str, Any]:
+    """
+    Get the JSON schema of an endpoint's request body from the app's OpenAPI spec.
+
+    Args:
+        app: Application serving the endpoint
+        path: Route path as it appears in the spec, e.g. ``/api/v1/policies/``
+        method: Lower-case HTTP method
+
+    Returns:
+        Component schema of the request body
+    """
+    spec = app.openapi()
+    body = spec["paths"][path][method]["requestBody"]["content"]["application/json"]
+    return spec["components"]["schemas"][body["schema"]["$ref"].rsplit("/", 1)[-1]]
+
+
+def build_minimal_body(schema: Dict[str, Any], **overrides: Any) -> Dict[str, Any]:
+    """
+    Build a body holding only the schema's required fields.
+
+    Required fields not given in ``overrides`` get a placeholder for their type.
+
+    Args:
+        schema: Object schema, as returned by ``request_schema``
+        **overrides: Field values to use instead of placeholders
+
+    Returns:
+        Request body
+    """
+    body = {
+        name: _SAMPLE_VALUES[schema["properties"][name]["type"]]
+        for name in schema.get("required", ())
+    }
+    body.update(overrides)
+    return body
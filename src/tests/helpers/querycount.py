@@ -0,0 +1,37 @@
+"""
+Query counting helpers for guarding against N+1 regressions.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Iterator, List
+
+from sqlalchemy import event
+
+
+@contextmanager
+def count_queries(bind: Any) -> Iterator[List[str]]:
+    """
+    Record every SQL statement executed on a bind while the block runs.
+
+    Args:
+        bind: Engine or connection, sync or async
+
+    Yields:
+        List that collects the executed SQL statements
+
+    Example:
+        with count_queries(engine) as queries:
+            await client.get("/api/v1/costs/records")
+        assert len(queries) <= 1
+    """
+    target = getattr(bind, "sync_engine", None) or getattr(bind, "sync_connection", None) or bind
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(target, "before_cursor_execute", before_cursor_execute)
@@ -5,11 +5,12 @@ Integration tests for cost management API endpoints.
 import pytest
 from fastapi import status
 
+from tests.helpers.querycount import count_queries
+
 
 class TestCostEndpoints:
     """Test cost management API endpoints."""
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_get_current_costs(self, async_client, db_session):
         """Test GET /api/v1/costs/current endpoint."""
@@ -21,7 +22,35 @@ class TestCostEndpoints:
         assert "currency" in data
         assert "by_service" in data
 
-    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_list_cost_records_single_query(
+        self, authenticated_client, test_db_engine, test_cost_record
+    ):
+        """Test that listing cost records issues one query regardless of row count."""
+        with count_queries(test_db_engine) as queries:
+            response = await authenticated_client.get("/api/v1/costs/records")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 1
+        assert len(queries) <= 1
+
+    @pytest.mark.integration
+    async def test_get_cost_summary(self, authenticated_client):
+        """Test GET /api/v1/costs/summary returns the documented summary schema."""
+        response = await authenticated_client.get("/api/v1/costs/summary")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["currency"] == "USD"
+        assert set(data) == {
+            "total_cost",
+            "currency",
+            "breakdown_by_provider",
+            "breakdown_by_service",
+            "trend",
+        }
+
     @pytest.mark.integration
     async def test_get_cost_breakdown(self, async_client, db_session):
         """Test GET /api/v1/costs/breakdown endpoint."""
@@ -38,7 +67,6 @@ class TestCostEndpoints:
         data = response.json()
         assert "total_cost" in data
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_detect_anomalies(self, async_client, db_session):
         """Test GET /api/v1/costs/anomalies endpoint."""
@@ -48,7 +76,6 @@ class TestCostEndpoints:
         data = response.json()
         assert isinstance(data, list)
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_get_forecast(self, async_client, db_session):
         """Test GET /api/v1/costs/forecast endpoint."""
@@ -59,7 +86,6 @@ class TestCostEndpoints:
         assert "forecasted_cost" in data
         assert "confidence" in data
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_get_recommendations(self, async_client, db_session):
         """Test GET /api/v1/costs/recommendations endpoint."""
@@ -69,7 +95,6 @@ class TestCostEndpoints:
         data = response.json()
         assert isinstance(data, list)
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_get_cost_trends(self, async_client, db_session):
         """Test GET /api/v1/costs/trends endpoint."""
@@ -83,7 +108,6 @@ class TestCostEndpoints:
 class TestCostValidation:
     """Test validation in cost endpoints."""
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_invalid_date_range(self, async_client, db_session):
         """Test handling of invalid date range."""
@@ -98,7 +122,6 @@ class TestCostValidation:
             status.HTTP_400_BAD_REQUEST,
         ]
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_forecast_invalid_days(self, async_client, db_session):
         """Test forecast with invalid days parameter."""
@@ -0,0 +1,36 @@
+"""
+Integration tests for the health endpoint served through the full middleware stack.
+"""
+
+import pytest
+from fastapi import status
+
+
+class TestHealthEndpoint:
+    """Test the health endpoint with all of the main app's middleware."""
+
+    @pytest.mark.integration
+    async def test_health_check(self, full_stack_client):
+        """Test GET /health is public and returns the service status."""
+        response = await full_stack_client.get("/health")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["service"] == "cloudops-central-api"
+
+    @pytest.mark.integration
+    async def test_health_check_security_headers(self, full_stack_client):
+        """Test security headers are added to responses."""
+        response = await full_stack_client.get("/health")
+
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert "Content-Security-Policy" in response.headers
+
+    @pytest.mark.integration
+    async def test_untrusted_host_rejected(self, full_stack_client):
+        """Test requests for hosts outside ALLOWED_HOSTS are rejected."""
+        response = await full_stack_client.get("/health", headers={"Host": "evil.example.com"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -2,126 +2,140 @@
 Integration tests for policy management API endpoints.
 """
 
+import asyncio
+
+import orjson
 import pytest
 from fastapi import status
 
+from main import app
+from tests.helpers.payloads import build_minimal_body, request_schema
 
-class TestPolicyEndpoints:
-    """Test policy management API endpoints."""
+# The endpoints under test are stubs that never query the database
+pytestmark = pytest.mark.no_db
 
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_list_policies(self, async_client, db_session):
-        """Test GET /api/v1/policies endpoint."""
-        response = await async_client.get("/api/v1/policies")
+POLICY_ID = 123
+POLICY_URL = f"/api/v1/policies/{POLICY_ID}"
 
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert isinstance(data, list)
+# Read-only endpoints requested together by test_read_endpoints_batch, in the
+# order the responses are unpacked there
+READ_URLS: tuple[str, ...] = (
+    "/api/v1/policies/",
+    POLICY_URL,
+    "/api/v1/policies/violations/",
+)
 
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_get_policy(self, async_client, db_session):
-        """Test GET /api/v1/policies/{policy_id} endpoint."""
-        policy_id = "policy-123"
-        response = await async_client.get(f"/api/v1/policies/{policy_id}")
+_OK_OR_404 = frozenset({status.HTTP_200_OK, status.HTTP_404_NOT_FOUND})
+
+_DELETED_OR_404 = frozenset(
+    {status.HTTP_204_NO_CONTENT, status.HTTP_200_OK, status.HTTP_404_NOT_FOUND}
+)
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+POLICY_SCHEMA = request_schema(app, "/api/v1/policies/", "post")
+
+# Bodies derived from the create endpoint's request schema, so they follow it
+# when it changes; test_policy_payloads_match_schema fails loudly if they drift.
+VALID_POLICY = build_minimal_body(
+    POLICY_SCHEMA, name="Test Policy", policy_type="security", severity="high"
+)
+
+INVALID_POLICY_MISSING_FIELDS = {"name": "Incomplete Policy"}
+
+_POLICY_UPDATE = VALID_POLICY | {"name": "Updated Policy Name", "severity": "critical"}
 
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert "id" in data
-        assert "name" in data
 
-    @pytest.mark.asyncio
+class TestPolicyEndpoints:
+    """Test policy management API endpoints."""
+
+    @pytest.mark.integration
+    async def test_read_endpoints_batch(self, authenticated_client):
+        """Test the read-only policy endpoints, requested concurrently."""
+        list_response, detail_response, violations_response = await asyncio.gather(
+            *(authenticated_client.get(url) for url in READ_URLS)
+        )
+
+        # GET /api/v1/policies/
+        assert list_response.status_code == status.HTTP_200_OK
+        assert isinstance(list_response.json(), list)
+
+        # GET /api/v1/policies/{policy_id}
+        assert detail_response.status_code == status.HTTP_200_OK
+        policy = detail_response.json()
+        assert "id" in policy
+        assert "name" in policy
+
+        # GET /api/v1/policies/violations/
+        assert violations_response.status_code == status.HTTP_200_OK
+        assert isinstance(violations_response.json(), list)
+
     @pytest.mark.integration
-    async def test_create_policy(self, async_client, db_session):
+    async def test_create_policy(self, authenticated_client):
         """Test POST /api/v1/policies endpoint."""
-        policy_data = {
-            "name": "Test Policy",
-            "description": "A test policy for integration testing",
-            "policy_type": "security",
-            "severity": "high",
-            "policy_code": "package test\n\ndefault allow = false",
-            "rule_engine": "opa",
-            "target_resources": ["ec2_instance", "rds_instance"],
-        }
-        response = await async_client.post("/api/v1/policies", json=policy_data)
+        response = await authenticated_client.post(
+            "/api/v1/policies/", content=orjson.dumps(VALID_POLICY), headers=_JSON_HEADERS
+        )
 
         assert response.status_code == status.HTTP_201_CREATED
         data = response.json()
         assert "id" in data
-        assert data["name"] == policy_data["name"]
+        assert data["name"] == VALID_POLICY["name"]
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_update_policy(self, async_client, db_session):
+    async def test_update_policy(self, authenticated_client):
         """Test PUT /api/v1/policies/{policy_id} endpoint."""
-        policy_id = "policy-123"
-        update_data = {"name": "Updated Policy Name", "severity": "critical"}
-        response = await async_client.put(f"/api/v1/policies/{policy_id}", json=update_data)
+        response = await authenticated_client.put(
+            POLICY_URL, content=orjson.dumps(_POLICY_UPDATE), headers=_JSON_HEADERS
+        )
 
-        assert response.status_code in [status.HTTP_200_OK, status.HTTP_404_NOT_FOUND]
+        assert response.status_code in _OK_OR_404
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_delete_policy(self, async_client, db_session):
+    async def test_delete_policy(self, authenticated_client):
         """Test DELETE /api/v1/policies/{policy_id} endpoint."""
-        policy_id = "policy-123"
-        response = await async_client.delete(f"/api/v1/policies/{policy_id}")
+        response = await authenticated_client.delete(POLICY_URL)
 
-        assert response.status_code in [
-            status.HTTP_204_NO_CONTENT,
-            status.HTTP_200_OK,
-            status.HTTP_404_NOT_FOUND,
-        ]
+        assert response.status_code in _DELETED_OR_404
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_check_compliance(self, async_client, db_session):
+    async def test_check_compliance(self, authenticated_client):
         """Test POST /api/v1/policies/check-compliance endpoint."""
         check_data = {"resource_id": "i-1234567890abcdef0"}
-        response = await async_client.post("/api/v1/policies/check-compliance", json=check_data)
+        response = await authenticated_client.post(
+            "/api/v1/policies/check-compliance", json=check_data
+        )
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert "compliant" in data
 
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_list_violations(self, async_client, db_session):
-        """Test GET /api/v1/policies/violations endpoint."""
-        response = await async_client.get("/api/v1/policies/violations")
-
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert isinstance(data, list)
-
 
 class TestPolicyValidation:
     """Test validation in policy endpoints."""
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_create_policy_missing_fields(self, async_client, db_session):
+    def test_policy_payloads_match_schema(self):
+        """Test that the shared payloads still fit the create endpoint's request schema."""
+        required = set(POLICY_SCHEMA["required"])
+
+        assert required <= VALID_POLICY.keys() <= POLICY_SCHEMA["properties"].keys()
+        assert required - INVALID_POLICY_MISSING_FIELDS.keys()
+
+    @pytest.mark.integration
+    async def test_create_policy_missing_fields(self, authenticated_client):
         """Test creating policy with missing required fields."""
-        invalid_data = {
-            "name": "Incomplete Policy"
-            # Missing required fields: policy_type, policy_code, etc.
-        }
-        response = await async_client.post("/api/v1/policies", json=invalid_data)
+        response = await authenticated_client.post(
+            "/api/v1/policies/", json=INVALID_POLICY_MISSING_FIELDS
+        )
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_create_policy_invalid_severity(self, async_client, db_session):
+    async def test_create_policy_invalid_severity(self, authenticated_client):
         """Test creating policy with invalid severity."""
-        invalid_data = {
-            "name": "Test Policy",
-            "policy_type": "security",
-            "severity": "invalid-severity",
-            "rules": {},
-        }
-        response = await async_client.post("/api/v1/policies", json=invalid_data)
+        invalid_data = VALID_POLICY | {"severity": "invalid-severity"}
+        response = await authenticated_client.post("/api/v1/policies/", json=invalid_data)
 
         assert response.status_code in [
             status.HTTP_422_UNPROCESSABLE_ENTITY,
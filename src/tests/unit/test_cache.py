@@ -0,0 +1,58 @@
+"""
+Unit tests for in-process caching.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache."""
+
+    @pytest.mark.unit
+    def test_get_and_set(self):
+        """Test storing and retrieving values."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing", "default") == "default"
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert len(cache) == 2
+
+    @pytest.mark.unit
+    def test_entries_expire(self):
+        """Test that entries expire after the TTL."""
+        cache = TTLCache(ttl=10)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("app.core.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_invalidate_and_clear(self):
+        """Test explicit invalidation."""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate("a")
+        cache.invalidate("missing")
+
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
@@ -7,6 +7,24 @@ from pydantic import ValidationError
 
 from app.core.config import Settings, get_settings
 
+ENVIRONMENTS = ["development", "staging", "production", "testing"]
+
+
+def construct_settings(**overrides) -> Settings:
+    """
+    Copy the cached settings with some fields replaced, skipping validation.
+
+    Test-only: ``model_construct`` runs no validators, so overrides must already
+    be valid, fully parsed values.
+    """
+    return Settings.model_construct(**(get_settings().model_dump() | overrides))
+
+
+@pytest.fixture(scope="module")
+def settings_by_env():
+    """Settings for each valid environment, validated once per module."""
+    return {env: Settings(ENVIRONMENT=env) for env in ENVIRONMENTS}
+
 
 class TestSettings:
     """Test Settings configuration class."""
@@ -14,7 +32,7 @@ class TestSettings:
     @pytest.mark.unit
     def test_default_settings(self):
         """Test default settings values."""
-        settings = Settings()
+        settings = get_settings()
 
         assert settings.APP_NAME == "CloudOps Central"
         assert settings.APP_VERSION == "1.0.0"
@@ -25,7 +43,8 @@ class TestSettings:
     @pytest.mark.unit
     def test_database_url_construction(self):
         """Test database URL construction."""
-        settings = Settings(
+        settings = construct_settings(
+            DATABASE_URL=None,
             DATABASE_HOST="testhost",
             DATABASE_PORT=5433,
             DATABASE_NAME="testdb",
@@ -43,7 +62,8 @@ class TestSettings:
     @pytest.mark.unit
     def test_redis_url_construction(self):
         """Test Redis URL construction."""
-        settings = Settings(
+        settings = construct_settings(
+            REDIS_URL=None,
             REDIS_HOST="redishost",
             REDIS_PORT=6380,
             REDIS_DB=1,
@@ -55,12 +75,11 @@ class TestSettings:
         assert "/1" in redis_url
 
     @pytest.mark.unit
-    def test_environment_validation(self):
+    def test_environment_validation(self, settings_by_env):
         """Test environment validation."""
         # Valid environments
-        for env in ["development", "staging", "production", "testing"]:
-            settings = Settings(ENVIRONMENT=env)
-            assert settings.ENVIRONMENT == env.lower()
+        for env in ENVIRONMENTS:
+            assert settings_by_env[env].ENVIRONMENT == env.lower()
 
         # Invalid environment should raise validation error
         with pytest.raises(ValidationError):
@@ -79,31 +98,22 @@ class TestSettings:
             Settings(LOG_LEVEL="INVALID")
 
     @pytest.mark.unit
-    def test_is_production(self):
+    def test_is_production(self, settings_by_env):
         """Test is_production method."""
-        settings_prod = Settings(ENVIRONMENT="production")
-        settings_dev = Settings(ENVIRONMENT="development")
-
-        assert settings_prod.is_production() is True
-        assert settings_dev.is_production() is False
+        assert settings_by_env["production"].is_production() is True
+        assert settings_by_env["development"].is_production() is False
 
     @pytest.mark.unit
-    def test_is_development(self):
+    def test_is_development(self, settings_by_env):
         """Test is_development method."""
-        settings_dev = Settings(ENVIRONMENT="development")
-        settings_prod = Settings(ENVIRONMENT="production")
-
-        assert settings_dev.is_development() is True
-        assert settings_prod.is_development() is False
+        assert settings_by_env["development"].is_development() is True
+        assert settings_by_env["production"].is_development() is False
 
     @pytest.mark.unit
-    def test_is_testing(self):
+    def test_is_testing(self, settings_by_env):
         """Test is_testing method."""
-        settings_test = Settings(ENVIRONMENT="testing")
-        settings_prod = Settings(ENVIRONMENT="production")
-
-        assert settings_test.is_testing() is True
-        assert settings_prod.is_testing() is False
+        assert settings_by_env["testing"].is_testing() is True
+        assert settings_by_env["production"].is_testing() is False
 
     @pytest.mark.unit
     def test_cors_origins_parsing(self):
@@ -139,3 +149,5 @@ class TestGetSettings:
 
         # Should return the same instance due to lru_cache
         assert settings1 is settings2
+        assert get_settings.cache_info().currsize == 1
+        assert get_settings.cache_info().hits >= 1
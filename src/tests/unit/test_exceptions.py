@@ -7,14 +7,14 @@ from datetime import datetime
 import pytest
 
 from app.core.exceptions import (
-    AuthenticationException,
-    AuthorizationException,
+    AuthenticationError,
+    AuthorizationError,
     CloudOpsException,
-    DatabaseException,
-    ExternalServiceException,
-    ResourceConflictException,
-    ResourceNotFoundException,
-    ValidationException,
+    ConflictError,
+    DatabaseError,
+    ExternalServiceError,
+    NotFoundError,
+    ValidationError,
 )
 
 
@@ -33,7 +33,7 @@ class TestCloudOpsException:
         assert exc.message == "Test error"
         assert exc.error_type == "test_error"
         assert exc.status_code == 500
-        assert exc.details is None
+        assert exc.details == {}
         assert isinstance(exc.timestamp, datetime)
 
     @pytest.mark.unit
@@ -62,117 +62,82 @@ class TestCloudOpsException:
         assert "Test error" in str_repr
 
 
-class TestDatabaseException:
-    """Test DatabaseException."""
+# (exception class, constructor kwargs, message, error type, status code, details)
+EXCEPTION_CASES = [
+    (
+        DatabaseError,
+        {"message": "Database connection failed", "details": {"host": "localhost", "port": 5432}},
+        "Database connection failed",
+        "database_error",
+        500,
+        {"host": "localhost", "port": 5432},
+    ),
+    (
+        ValidationError,
+        {"message": "Invalid email format", "field": "email", "value": "invalid-email"},
+        "Invalid email format",
+        "validation_error",
+        400,
+        {"field": "email", "value": "invalid-email"},
+    ),
+    (
+        AuthenticationError,
+        {"message": "Invalid credentials"},
+        "Invalid credentials",
+        "authentication_error",
+        401,
+        {},
+    ),
+    (
+        AuthorizationError,
+        {"message": "Insufficient permissions", "required_permission": "admin"},
+        "Insufficient permissions",
+        "authorization_error",
+        403,
+        {"required_permission": "admin"},
+    ),
+    (
+        NotFoundError,
+        {"resource_type": "user", "resource_id": "123"},
+        "user not found with ID: 123",
+        "not_found_error",
+        404,
+        {"resource_type": "user", "resource_id": "123"},
+    ),
+    (
+        ConflictError,
+        {"message": "Resource already exists", "resource_type": "user"},
+        "Resource already exists",
+        "conflict_error",
+        409,
+        {"resource_type": "user"},
+    ),
+    (
+        ExternalServiceError,
+        {"service_name": "EC2", "message": "DescribeInstances call failed"},
+        "EC2 error: DescribeInstances call failed",
+        "external_service_error",
+        502,
+        {"service_name": "EC2"},
+    ),
+]
+
+
+class TestExceptionSubclasses:
+    """Test the specific CloudOpsException subclasses."""
 
     @pytest.mark.unit
-    def test_database_exception(self):
-        """Test database exception creation."""
-        exc = DatabaseException(
-            message="Database connection failed",
-            details={"host": "localhost", "port": 5432},
-        )
-
-        assert exc.message == "Database connection failed"
-        assert exc.error_type == "database_error"
-        assert exc.status_code == 500
-        assert exc.details["host"] == "localhost"
-
-
-class TestValidationException:
-    """Test ValidationException."""
-
-    @pytest.mark.unit
-    def test_validation_exception(self):
-        """Test validation exception creation."""
-        exc = ValidationException(
-            message="Invalid email format",
-            details={"field": "email", "value": "invalid-email"},
-        )
-
-        assert exc.message == "Invalid email format"
-        assert exc.error_type == "validation_error"
-        assert exc.status_code == 422
-        assert exc.details["field"] == "email"
-
-
-class TestAuthenticationException:
-    """Test AuthenticationException."""
-
-    @pytest.mark.unit
-    def test_authentication_exception(self):
-        """Test authentication exception creation."""
-        exc = AuthenticationException(
-            message="Invalid credentials",
-        )
-
-        assert exc.message == "Invalid credentials"
-        assert exc.error_type == "authentication_error"
-        assert exc.status_code == 401
-
-
-class TestAuthorizationException:
-    """Test AuthorizationException."""
-
-    @pytest.mark.unit
-    def test_authorization_exception(self):
-        """Test authorization exception creation."""
-        exc = AuthorizationException(
-            message="Insufficient permissions",
-            details={"required_role": "admin"},
-        )
-
-        assert exc.message == "Insufficient permissions"
-        assert exc.error_type == "authorization_error"
-        assert exc.status_code == 403
-        assert exc.details["required_role"] == "admin"
-
-
-class TestResourceNotFoundException:
-    """Test ResourceNotFoundException."""
-
-    @pytest.mark.unit
-    def test_resource_not_found_exception(self):
-        """Test resource not found exception creation."""
-        exc = ResourceNotFoundException(
-            message="Resource not found",
-            details={"resource_type": "user", "resource_id": "123"},
-        )
-
-        assert exc.message == "Resource not found"
-        assert exc.error_type == "resource_not_found"
-        assert exc.status_code == 404
-        assert exc.details["resource_type"] == "user"
-
-
-class TestResourceConflictException:
-    """Test ResourceConflictException."""
-
-    @pytest.mark.unit
-    def test_resource_conflict_exception(self):
-        """Test resource conflict exception creation."""
-        exc = ResourceConflictException(
-            message="Resource already exists",
-            details={"resource_type": "user", "email": "test@example.com"},
-        )
-
-        assert exc.message == "Resource already exists"
-        assert exc.error_type == "resource_conflict"
-        assert exc.status_code == 409
-
-
-class TestExternalServiceException:
-    """Test ExternalServiceException."""
-
-    @pytest.mark.unit
-    def test_external_service_exception(self):
-        """Test external service exception creation."""
-        exc = ExternalServiceException(
-            message="AWS API call failed",
-            details={"service": "EC2", "operation": "DescribeInstances"},
-        )
-
-        assert exc.message == "AWS API call failed"
-        assert exc.error_type == "external_service_error"
-        assert exc.status_code == 502
-        assert exc.details["service"] == "EC2"
+    @pytest.mark.parametrize(
+        "exc_cls, kwargs, message, error_type, status_code, details",
+        EXCEPTION_CASES,
+        ids=[case[0].__name__ for case in EXCEPTION_CASES],
+    )
+    def test_exception_shape(self, exc_cls, kwargs, message, error_type, status_code, details):
+        """Test message, error type, status code and details of each subclass."""
+        exc = exc_cls(**kwargs)
+
+        assert isinstance(exc, CloudOpsException)
+        assert exc.message == message
+        assert exc.error_type == error_type
+        assert exc.status_code == status_code
+        assert exc.details == details
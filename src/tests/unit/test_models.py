@@ -3,63 +3,58 @@ Unit tests for database models.
 """
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from sqlalchemy import select
 
 from app.models.base import BaseModel, NamedModel
-from app.models.costs import CostRecord
+from app.models.costs import (
+    AlertStatus,
+    CostAlert,
+    CostBudget,
+    CostRecord,
+    CostRecordRow,
+    to_micros,
+)
 from app.models.infrastructure import CloudProvider, InfrastructureResource
 from app.models.policies import Policy
 from app.models.users import Role, User
 
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+YESTERDAY = NOW - timedelta(days=1)
+
 
 class TestBaseModelMixins:
     """Test base model mixins functionality."""
 
-    @pytest.mark.asyncio
     @pytest.mark.unit
-    async def test_uuid_mixin(self, db_session):
+    async def test_uuid_mixin(self, test_cloud_provider):
         """Test UUID primary key generation."""
-        provider = CloudProvider(
-            name="Test Provider",
-            provider_type="aws",
-            is_enabled=True,
-        )
-        db_session.add(provider)
-        await db_session.commit()
+        provider = test_cloud_provider
 
         assert isinstance(provider.id, uuid.UUID)
         assert provider.id is not None
 
-    @pytest.mark.asyncio
     @pytest.mark.unit
-    async def test_timestamp_mixin(self, db_session):
+    async def test_timestamp_mixin(self, test_cloud_provider):
         """Test automatic timestamp generation."""
-        provider = CloudProvider(
-            name="Test Provider",
-            provider_type="aws",
-            is_enabled=True,
-        )
-        db_session.add(provider)
-        await db_session.commit()
+        provider = test_cloud_provider
 
         assert isinstance(provider.created_at, datetime)
         assert isinstance(provider.updated_at, datetime)
         assert provider.created_at <= provider.updated_at
 
-    @pytest.mark.asyncio
     @pytest.mark.unit
-    async def test_soft_delete_mixin(self, db_session):
+    def test_soft_delete_mixin(self):
         """Test soft delete functionality."""
+        # soft_delete/restore only set deleted_at, so no row is needed
         provider = CloudProvider(
             name="Test Provider",
             provider_type="aws",
-            is_enabled=True,
+            is_active=True,
         )
-        db_session.add(provider)
-        await db_session.commit()
 
         # Test soft delete
         assert not provider.is_deleted
@@ -72,14 +67,13 @@ class TestBaseModelMixins:
         assert not provider.is_deleted
         assert provider.deleted_at is None
 
-    @pytest.mark.asyncio
     @pytest.mark.unit
-    async def test_metadata_mixin(self, db_session):
+    def test_metadata_mixin(self):
         """Test metadata and tags functionality."""
         provider = CloudProvider(
             name="Test Provider",
             provider_type="aws",
-            is_enabled=True,
+            is_active=True,
         )
 
         # Test metadata
@@ -100,33 +94,42 @@ class TestBaseModelMixins:
         provider.remove_tag("environment")
         assert not provider.has_tag("environment")
 
+    @pytest.mark.unit
+    def test_pg_enum_stores_values(self):
+        """Test that enum columns map to named native types storing member values."""
+        column_type = CloudProvider.__table__.c.provider_type.type
+
+        assert column_type.name == "cloudprovidertype"
+        assert column_type.native_enum is True
+        assert "aws" in column_type.enums
+
 
 class TestCloudProviderModel:
     """Test CloudProvider model."""
 
-    @pytest.mark.asyncio
     @pytest.mark.unit
     async def test_create_cloud_provider(self, db_session):
         """Test creating a cloud provider."""
+        # Named apart from the seeded "AWS" provider, which shares the provider type
         provider = CloudProvider(
-            name="AWS",
+            name="AWS GovCloud",
             provider_type="aws",
-            description="Amazon Web Services",
-            is_enabled=True,
+            description="Amazon Web Services GovCloud",
+            is_active=True,
             configuration={"region": "us-east-1"},
         )
         db_session.add(provider)
-        await db_session.commit()
+        await db_session.flush()
 
-        result = await db_session.execute(select(CloudProvider).where(CloudProvider.name == "AWS"))
-        saved_provider = result.scalar_one()
+        # Detach the instance so get() reads the row back instead of the identity map
+        db_session.expunge(provider)
+        saved_provider = await db_session.get(CloudProvider, provider.id)
 
-        assert saved_provider.name == "AWS"
+        assert saved_provider.name == "AWS GovCloud"
         assert saved_provider.provider_type == "aws"
-        assert saved_provider.is_enabled is True
+        assert saved_provider.is_active is True
         assert saved_provider.configuration["region"] == "us-east-1"
 
-    @pytest.mark.asyncio
     @pytest.mark.unit
     async def test_cloud_provider_to_dict(self, test_cloud_provider):
         """Test converting cloud provider to dictionary."""
@@ -141,7 +144,6 @@ class TestCloudProviderModel:
 class TestInfrastructureResourceModel:
     """Test InfrastructureResource model."""
 
-    @pytest.mark.asyncio
     @pytest.mark.unit
     async def test_create_infrastructure_resource(
         self, db_session, test_cloud_provider, test_resource_type
@@ -157,27 +159,66 @@ class TestInfrastructureResourceModel:
             resource_type_id=test_resource_type.id,
             region="us-east-1",
             resource_status=ResourceStatus.RUNNING,
-            configuration={"instance_type": "t3.medium"},
+            desired_configuration={"instance_type": "t3.medium"},
         )
         db_session.add(resource)
-        await db_session.commit()
+        await db_session.flush()
 
-        result = await db_session.execute(
-            select(InfrastructureResource).where(
-                InfrastructureResource.external_id == "i-1234567890"
-            )
+        assert resource.id is not None
+        assert resource.name == "web-server"
+        assert resource.resource_status == ResourceStatus.RUNNING
+        assert resource.cloud_provider_id == test_cloud_provider.id
+
+    @pytest.mark.unit
+    def test_reference_relationships_batch_loaded(self):
+        """Test that a resource's provider and type load with SELECT IN."""
+        from sqlalchemy import inspect
+
+        relationships = inspect(InfrastructureResource).relationships
+        assert relationships["cloud_provider"].lazy == "selectin"
+        assert relationships["resource_type"].lazy == "selectin"
+
+    @pytest.mark.unit
+    def test_configuration_stored_in_single_state(self):
+        """Test that desired/actual configuration share one JSONB state column."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateTable
+
+        resource = InfrastructureResource(desired_configuration={"instance_type": "t3.medium"})
+        resource.actual_configuration = {"instance_type": "t3.large"}
+
+        assert resource.state == {
+            "desired": {"instance_type": "t3.medium"},
+            "actual": {"instance_type": "t3.large"},
+        }
+
+        ddl = str(
+            CreateTable(InfrastructureResource.__table__).compile(dialect=postgresql.dialect())
         )
-        saved_resource = result.scalar_one()
+        assert "drift_detected BOOLEAN GENERATED ALWAYS AS" in ddl
+        assert "actual_configuration" not in ddl
+
+
+class TestInfrastructureTemplateModel:
+    """Test InfrastructureTemplate model."""
+
+    @pytest.mark.unit
+    def test_resource_types_batch_loaded(self):
+        """Test that the template/resource type association loads with SELECT IN."""
+        from sqlalchemy import inspect
+
+        from app.models.infrastructure import InfrastructureTemplate, ResourceType
 
-        assert saved_resource.name == "web-server"
-        assert saved_resource.resource_status == ResourceStatus.RUNNING
-        assert saved_resource.cloud_provider_id == test_cloud_provider.id
+        assert inspect(InfrastructureTemplate).relationships["resource_types"].lazy == "selectin"
+        assert inspect(ResourceType).relationships["templates"].lazy == "selectin"
+
+        association = InfrastructureTemplate.__table__.metadata.tables["template_resource_types"]
+        assert "ix_trt_resource_type" in {index.name for index in association.indexes}
 
 
 class TestUserModel:
     """Test User model."""
 
-    @pytest.mark.asyncio
     @pytest.mark.unit
     async def test_create_user(self, db_session):
         """Test creating a user."""
@@ -192,21 +233,205 @@ class TestUserModel:
             user_status=UserStatus.ACTIVE,
         )
         db_session.add(user)
-        await db_session.commit()
+        await db_session.flush()
+
+        assert user.id is not None
+        assert user.username == "testuser"
+        assert user.first_name == "Test"
+        assert user.last_name == "User"
+        assert user.user_status == UserStatus.ACTIVE
+
+    @pytest.mark.unit
+    def test_permissions_resolved_from_role_sets(self):
+        """Test that permission checks use the union of the user's role permission sets."""
+        from app.models.users import UserRole
+
+        reader = Role(name="reader", permissions=["costs:read"])
+        writer = Role(name="writer", permissions=["costs:write"])
+        user = User(email="test@example.com", is_superuser=False)
+        user.user_roles = [UserRole(role=reader, is_active=True)]
+
+        assert user.has_permission("costs:read")
+        assert not user.has_permission("costs:write")
+
+        user.user_roles.append(UserRole(role=writer, is_active=True))
+        assert user.has_permission("costs:write")
+
+    @pytest.mark.unit
+    def test_roles_not_eager_loaded_by_default(self):
+        """Test that roles only load eagerly where a query asks for them."""
+        from sqlalchemy import inspect
+
+        from app.models.users import UserRole
+
+        assert inspect(User).relationships["user_roles"].lazy == "select"
+        assert inspect(UserRole).relationships["role"].lazy == "select"
+
+    @pytest.mark.unit
+    def test_permissions_follow_role_assignment_validity(self):
+        """Test that deactivated or expired role assignments stop granting permissions."""
+        from app.models.users import UserRole
+
+        user_role = UserRole(role=Role(name="reader", permissions=["costs:read"]), is_active=True)
+        user = User(email="test@example.com", is_superuser=False)
+        user.user_roles = [user_role]
+        assert user.has_permission("costs:read")
+
+        user_role.is_active = False
+        assert not user.has_permission("costs:read")
+
+        user_role.is_active = True
+        user_role.expires_at = datetime.utcnow() - timedelta(minutes=1)
+        assert not user.has_permission("costs:read")
+
+    @pytest.mark.unit
+    def test_role_permission_set_tracks_changes(self):
+        """Test that the cached permission set follows add/remove calls."""
+        role = Role(name="reader", permissions=["costs:read"])
+        assert role.has_permission("costs:read")
+
+        role.add_permission("costs:write")
+        assert role.has_permission("costs:write")
+        assert role.permissions == ["costs:read", "costs:write"]
+
+        role.remove_permission("costs:read")
+        assert not role.has_permission("costs:read")
+
+    @pytest.mark.unit
+    async def test_role_permissions_updated_in_place(self):
+        """Test that server-side grants and revokes send only the changed permission."""
+        from sqlalchemy.dialects import postgresql
+
+        session = AsyncMock()
+        session.execute.return_value = Mock(rowcount=1)
+        role_id = uuid.uuid4()
+
+        assert await Role.grant_permission(session, role_id, "costs:write") == 1
+        statement = session.execute.call_args.args[0]
+        assert statement.get_execution_options()["synchronize_session"] == "fetch"
+        grant = statement.compile(dialect=postgresql.dialect())
+        assert "permissions=(roles.permissions || CAST(" in str(grant)
+        assert "NOT roles.permissions ?" in str(grant)
+
+        assert await Role.revoke_permission(session, role_id, "costs:write") == 1
+        revoke = session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        assert "permissions=(roles.permissions - %(permissions_1)s)" in str(revoke)
+        assert revoke.params["permissions_1"] == "costs:write"
+
+    @pytest.mark.unit
+    def test_validity_predicates_usable_in_sql(self):
+        """Test that lock and validity checks work on instances and in WHERE clauses."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.models.users import ApiKey, UserStatus
+
+        now = datetime(2024, 1, 1)
+        assert User(user_status=UserStatus.LOCKED).is_account_locked(now)
+        assert not User(user_status=UserStatus.ACTIVE, locked_until=None).is_account_locked(now)
+
+        locked = str(
+            select(User.id).where(User.is_account_locked()).compile(dialect=postgresql.dialect())
+        )
+        assert "users.locked_until > now()" in locked
+
+        valid = str(select(ApiKey.id).where(ApiKey.is_valid()).compile())
+        assert "api_keys.is_active AND (api_keys.expires_at IS NULL" in valid
 
-        result = await db_session.execute(select(User).where(User.email == "test@example.com"))
-        saved_user = result.scalar_one()
+    @pytest.mark.unit
+    async def test_login_record_selects_columns_not_entities(self):
+        """Test that sign-in lookups fetch a narrow row by email or username."""
+        record = {"id": uuid.uuid4(), "email": "ops@example.com"}
+        session = AsyncMock()
+        session.execute.return_value.mappings = Mock(
+            return_value=Mock(first=Mock(return_value=record))
+        )
+
+        assert await User.get_login_record(session, "ops@example.com") is record
+
+        stmt, params = session.execute.call_args.args
+        assert params == {"login": "ops@example.com"}
+        assert all(desc["type"] is not User for desc in stmt.column_descriptions)
+        sql = str(stmt)
+        assert "users.email = :login OR users.username = :login" in sql
+        assert "users.first_name" not in sql
+
+    @pytest.mark.unit
+    async def test_login_record_prefers_email_match(self, db_session):
+        """Test that a login matching one user's email and another's username is unambiguous."""
+        by_email = User(name="ops", email="ops@example.com", hashed_password="x")
+        by_username = User(
+            name="other", email="other@example.com", username="ops@example.com", hashed_password="x"
+        )
+        db_session.add_all([by_username, by_email])
+        await db_session.flush()
+
+        record = await User.get_login_record(db_session, "ops@example.com")
+
+        assert record["id"] == by_email.id
+
+    @pytest.mark.unit
+    async def test_api_key_looked_up_by_digest(self):
+        """Test that API keys are matched on their raw SHA-256 digest."""
+        import hashlib
+
+        from sqlalchemy.dialects import postgresql
+
+        from app.models.users import ApiKey
+
+        digest = ApiKey.hash_key("cok_secret")
+        assert digest == hashlib.sha256(b"cok_secret").digest()
+        assert len(digest) == 32
+        assert str(ApiKey.__table__.c.key_hash.type.compile(dialect=postgresql.dialect())) == (
+            "BYTEA"
+        )
 
-        assert saved_user.username == "testuser"
-        assert saved_user.first_name == "Test"
-        assert saved_user.last_name == "User"
-        assert saved_user.user_status == UserStatus.ACTIVE
+        session = AsyncMock()
+        session.execute.return_value = Mock()
+        await ApiKey.get_by_raw_key(session, "cok_secret")
+
+        stmt, params = session.execute.call_args.args
+        assert params == {"key_hash": digest}
+        assert "api_keys.key_hash = :key_hash" in str(stmt)
+        assert "last_used_at" not in str(stmt)
+
+    @pytest.mark.unit
+    def test_api_key_lookup_index_covers_auth_columns(self):
+        """Test that the API key lookup index is unique and covering."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex
+
+        from app.models.users import ApiKey
+
+        (index,) = ApiKey.__table__.indexes
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+        assert ddl.startswith("CREATE UNIQUE INDEX ix_api_keys_lookup ON api_keys (key_hash)")
+        assert "INCLUDE (user_id, is_active, expires_at, permissions)" in ddl
+
+    @pytest.mark.unit
+    async def test_mark_used_updates_loaded_key(self, db_session):
+        """Test that a key already loaded in the session sees the recorded usage."""
+        from app.models.users import ApiKey
+
+        api_key = ApiKey(
+            user_id=uuid.uuid4(),
+            name="ci",
+            key_hash=ApiKey.hash_key("cok_ci"),
+            prefix="cok_ci",
+            last_used_at=datetime(2024, 1, 1),
+            last_used_ip="10.0.0.0",
+        )
+        db_session.add(api_key)
+        await db_session.flush()
+
+        assert await ApiKey.mark_used(db_session, api_key.id, "10.0.0.1") == 1
+        assert api_key.last_used_ip == "10.0.0.1"
+        assert "last_used_at" not in api_key.__dict__
 
 
 class TestPolicyModel:
     """Test Policy model."""
 
-    @pytest.mark.asyncio
     @pytest.mark.unit
     async def test_create_policy(self, db_session):
         """Test creating a policy."""
@@ -222,29 +447,324 @@ class TestPolicyModel:
             target_resources=["ec2_instance"],
         )
         db_session.add(policy)
-        await db_session.commit()
+        await db_session.flush()
+
+        assert policy.id is not None
+        assert policy.policy_type == PolicyType.SECURITY
+        assert policy.severity == PolicySeverity.HIGH
+        assert "package test" in policy.policy_code
+
+    @pytest.mark.unit
+    def test_violation_counters_maintained_by_trigger(self):
+        """Test that violation counters are denormalized onto policies by a trigger."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.models.policies import _violation_count_ddl
+
+        table = Policy.__table__
+        assert table.c.open_violation_count.server_default.arg == "0"
+        assert table.c.critical_violation_count.server_default.arg == "0"
+
+        function, trigger = (
+            str(ddl.compile(dialect=postgresql.dialect())) for ddl in _violation_count_ddl()
+        )
+        assert "OLD.violation_status = 0" in function
+        assert "(NEW.severity = 3)::int" in function
+        assert "ON policy_violations FOR EACH ROW" in trigger
+
+    @pytest.mark.unit
+    def test_updates_guarded_by_lock_version(self):
+        """Test that policies use optimistic concurrency and return server defaults."""
+        from sqlalchemy import inspect
+
+        mapper = inspect(Policy)
+
+        assert mapper.version_id_col is Policy.__table__.c.lock_version
+        assert mapper.eager_defaults is True
+
+    @pytest.mark.unit
+    def test_custom_policy_compiled_once(self):
+        """Test that custom policy code is compiled once and shared across instances."""
+        from app.models.policies import RuleEngine
+
+        policy_id = uuid.uuid4()
+        kwargs = dict(
+            id=policy_id,
+            name="Custom",
+            rule_engine=RuleEngine.CUSTOM,
+            lock_version=1,
+            policy_code="allow = True",
+        )
+        first = Policy(**kwargs)
+        second = Policy(**kwargs)
+
+        assert first.compiled is second.compiled
+
+        first.policy_code = "allow = False"
+        assert first.compiled is not second.compiled
+
+        previous = second.compiled
+        second.lock_version = 2
+        assert second.compiled is not previous
+
+        opa = Policy(name="Rego", rule_engine=RuleEngine.OPA, policy_code="package x")
+        assert opa.compiled is None
+
+    @pytest.mark.unit
+    async def test_find_applicable_uses_jsonb_containment(self):
+        """Test that applicable policies are found with GIN-indexable containment."""
+        from sqlalchemy.dialects import postgresql
+
+        session = AsyncMock()
+        session.execute.return_value = Mock()
+        await Policy.find_applicable(session, "ec2_instance", environment="production")
+
+        stmt = session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "policies.target_resources @> CAST(" in sql
+        assert "policies.target_environments @> CAST(" in sql
+        assert "AS JSONB)" in sql
+
+    @pytest.mark.unit
+    async def test_active_rules_filtered_in_sql(self):
+        """Test that active rules are selected by a SQL predicate, not in Python."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.models.policies import PolicyRule
+
+        session = AsyncMock()
+        session.execute.return_value = Mock()
+        await PolicyRule.fetch_active_rules(session, uuid.uuid4())
+
+        stmt = session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "policy_rules.is_active" in sql
+        assert "ORDER BY policy_rules.order_index" in sql
+        assert "policy_rules.error_message" not in sql
+        assert Policy.active_rules.property.viewonly is True
+
+    @pytest.mark.unit
+    async def test_violation_count_uses_sql_aggregate(self):
+        """Test that violations are counted in the database when not loaded."""
+        from app.models.policies import ViolationStatus
+
+        policy = Policy(id=uuid.uuid4(), name="Security Policy")
+        session = AsyncMock()
+        session.scalar.return_value = 3
+
+        assert await policy.get_violation_count(session, ViolationStatus.OPEN) == 3
+        sql = str(session.scalar.call_args.args[0])
+        assert "count(*)" in sql
+        assert "policy_violations.violation_status" in sql
+
+    @pytest.mark.unit
+    async def test_violation_count_uses_loaded_collection(self):
+        """Test that an already-loaded violations collection is counted in memory."""
+        from app.models.policies import PolicyViolation, ViolationStatus
 
-        result = await db_session.execute(select(Policy).where(Policy.name == "Security Policy"))
-        saved_policy = result.scalar_one()
+        policy = Policy(name="Security Policy")
+        policy.violations = [
+            PolicyViolation(violation_status=ViolationStatus.OPEN),
+            PolicyViolation(violation_status=ViolationStatus.RESOLVED),
+        ]
+        session = AsyncMock()
 
-        assert saved_policy.policy_type == PolicyType.SECURITY
-        assert saved_policy.severity == PolicySeverity.HIGH
-        assert "package test" in saved_policy.policy_code
+        assert await policy.get_violation_count(session, ViolationStatus.OPEN) == 1
+        assert await policy.get_violation_count(session) == 2
+        session.scalar.assert_not_called()
+
+
+class TestPolicyViolationModel:
+    """Test PolicyViolation model."""
+
+    @pytest.mark.unit
+    def test_timestamps_stamped_by_database(self):
+        """Test that violation timestamps are produced server-side."""
+        from app.models.policies import PolicyViolation, ViolationStatus
+
+        table = PolicyViolation.__table__
+        assert table.c.detected_at.server_default is not None
+        assert table.c.last_seen_at.server_default is not None
+        assert table.c.detected_at.default is None
+
+        violation = PolicyViolation(name="Unencrypted volume")
+        violation.resolve(uuid.uuid4(), notes="encrypted")
+        assert violation.violation_status == ViolationStatus.RESOLVED
+        assert str(violation.resolved_at) == "now()"
+
+    @pytest.mark.unit
+    def test_enums_stored_as_small_integers(self):
+        """Test that enum columns round-trip through SMALLINT ordinals."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.models.policies import PolicySeverity, PolicyViolation, ViolationStatus
+
+        severity_type = PolicyViolation.__table__.c.severity.type
+        dialect = postgresql.dialect()
+        assert str(severity_type.compile(dialect=dialect)) == "SMALLINT"
+        assert severity_type.process_bind_param(PolicySeverity.LOW, dialect) == 0
+        assert severity_type.process_bind_param("critical", dialect) == 3
+        assert severity_type.process_result_value(2, dialect) is PolicySeverity.HIGH
+
+        stmt = select(PolicyViolation.id).where(
+            PolicyViolation.violation_status == ViolationStatus.RESOLVED
+        )
+        compiled = stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        assert "policy_violations.violation_status = 2" in str(compiled)
+
+    @pytest.mark.unit
+    async def test_iter_open_streams_plain_rows(self):
+        """Test that open violations are streamed as rows rather than ORM objects."""
+        from app.models.policies import PolicyViolation
+
+        rows = [(uuid.uuid4(), uuid.uuid4(), "vol-1", "high")]
+
+        async def stream():
+            for row in rows:
+                yield row
+
+        session = AsyncMock()
+        session.stream.return_value = stream()
+
+        received = [row async for row in PolicyViolation.iter_open(session, batch_size=500)]
+
+        assert received == rows
+        stmt = session.stream.call_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] == 500
+        assert [c.name for c in stmt.selected_columns] == [
+            "id",
+            "policy_id",
+            "resource_identifier",
+            "severity",
+        ]
+
+    @pytest.mark.unit
+    async def test_count_open_by_severity_single_grouped_query(self):
+        """Test that open violation counts come from one GROUP BY query, zero-filled."""
+        from app.models.policies import PolicySeverity, PolicyViolation
+
+        session = AsyncMock()
+        session.execute.return_value.tuples = Mock(
+            return_value=Mock(all=Mock(return_value=[(PolicySeverity.CRITICAL, 2)]))
+        )
+
+        counts = await PolicyViolation.count_open_by_severity(session)
+
+        assert counts == {
+            PolicySeverity.LOW: 0,
+            PolicySeverity.MEDIUM: 0,
+            PolicySeverity.HIGH: 0,
+            PolicySeverity.CRITICAL: 2,
+        }
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.call_args.args[0])
+        assert "GROUP BY policy_violations.severity" in sql
+
+    @pytest.mark.unit
+    def test_filter_active_reads_clock_once(self):
+        """Test that bulk suppression checks share a single clock reading."""
+        from unittest.mock import patch
+
+        from app.models.policies import PolicyViolation, ViolationStatus
+
+        now = datetime(2024, 1, 1)
+        open_violation = PolicyViolation(violation_status=ViolationStatus.OPEN)
+        snoozed = PolicyViolation(
+            violation_status=ViolationStatus.OPEN, suppressed_until=now + timedelta(hours=1)
+        )
+        expired_snooze = PolicyViolation(
+            violation_status=ViolationStatus.OPEN, suppressed_until=now - timedelta(hours=1)
+        )
+        resolved = PolicyViolation(violation_status=ViolationStatus.RESOLVED)
+
+        with patch("app.models.policies.request_now", return_value=now) as clock:
+            active = PolicyViolation.filter_active(
+                [open_violation, snoozed, expired_snooze, resolved]
+            )
+
+        assert active == [open_violation, expired_snooze]
+        clock.assert_called_once()
+
+    @pytest.mark.unit
+    def test_policy_enum_columns_map_stdlib_enums(self):
+        """Test that policy enum columns are built from stdlib enum classes."""
+        import enum
+
+        from app.models.base import SmallIntEnum
+        from app.models.policies import PolicyExemption, PolicyRule, PolicyViolation
+
+        for model in (Policy, PolicyRule, PolicyViolation, PolicyExemption):
+            for column in model.__table__.columns:
+                if isinstance(column.type, SmallIntEnum):
+                    assert issubclass(column.type.enum_cls, enum.Enum)
+
+    @pytest.mark.unit
+    def test_dashboard_indexes(self):
+        """Test the partial and covering indexes used by violation dashboards."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex
+
+        from app.models.policies import PolicyViolation
+
+        ddl = {
+            index.name: str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+            for index in PolicyViolation.__table__.indexes
+        }
+
+        assert ddl["ix_violations_open_policy"].endswith(
+            "(policy_id, severity) WHERE violation_status = 0"
+        )
+        assert ddl["ix_violations_suppressed_until"].endswith("WHERE violation_status = 3")
+        assert "INCLUDE (violation_status, severity, detected_at)" in (
+            ddl["ix_violations_policy_counts"]
+        )
+        assert set(ddl) == {
+            "ix_violations_open_policy",
+            "ix_violations_suppressed_until",
+            "ix_violations_policy_counts",
+        }
+
+    @pytest.mark.unit
+    async def test_bulk_resolve_single_statement(self):
+        """Test that bulk_resolve issues one UPDATE for all violations."""
+        from app.models.policies import PolicyViolation
+
+        session = AsyncMock()
+        session.execute.return_value = Mock(rowcount=2)
+        ids = [uuid.uuid4(), uuid.uuid4()]
+
+        updated = await PolicyViolation.bulk_resolve(session, ids, uuid.uuid4(), notes="fixed")
+
+        assert updated == 2
+        session.execute.assert_awaited_once()
+        stmt = session.execute.call_args.args[0]
+        assert str(stmt).startswith("UPDATE policy_violations")
+        assert "resolution_notes" in str(stmt)
+
+    @pytest.mark.unit
+    async def test_bulk_mark_seen(self):
+        """Test that last_seen_at is stamped for many violations at once."""
+        from app.models.policies import PolicyViolation
+
+        session = AsyncMock()
+        session.execute.return_value = Mock(rowcount=1)
+
+        assert await PolicyViolation.bulk_mark_seen(session, [uuid.uuid4()]) == 1
+        assert "last_seen_at=now()" in str(session.execute.call_args.args[0])
+        assert await PolicyViolation.bulk_mark_seen(session, []) == 0
+        session.execute.assert_awaited_once()
 
 
 class TestCostRecordModel:
     """Test CostRecord model."""
 
-    @pytest.mark.asyncio
     @pytest.mark.unit
     async def test_create_cost_record(
         self, db_session, test_infrastructure_resource, test_cloud_provider
     ):
         """Test creating a cost record."""
-        from datetime import datetime, timedelta
         from decimal import Decimal
 
-        now = datetime.utcnow()
         cost = CostRecord(
             resource_id=test_infrastructure_resource.id,
             cloud_provider_id=test_cloud_provider.id,
@@ -254,18 +774,209 @@ class TestCostRecordModel:
             region="us-east-1",
             cost_amount=Decimal("150.75"),
             currency="USD",
-            billing_period_start=now - timedelta(days=1),
-            billing_period_end=now,
+            billing_period_start=YESTERDAY,
+            billing_period_end=NOW,
             cost_details={},
         )
         db_session.add(cost)
-        await db_session.commit()
+        await db_session.flush()
+
+        assert cost.id is not None
+        assert cost.cost_amount == Decimal("150.75")
+        assert cost.currency == "USD"
+        assert cost.service_name == "EC2"
+
+    @pytest.mark.unit
+    async def test_bulk_insert_single_executemany(self):
+        """Test that bulk_insert sends all rows in one executemany call."""
+        from decimal import Decimal
 
-        result = await db_session.execute(
-            select(CostRecord).where(CostRecord.resource_id == test_infrastructure_resource.id)
+        session = AsyncMock()
+        records = [
+            {
+                "cloud_provider_id": uuid.uuid4(),
+                "service_name": "EC2",
+                "resource_type": "Instance",
+                "resource_identifier": f"i-{i}",
+                "cost_amount_micros": to_micros(Decimal("1.25")),
+                "billing_period_start": datetime(2025, 10, 1),
+                "billing_period_end": datetime(2025, 10, 2),
+            }
+            for i in range(3)
+        ]
+
+        inserted = await CostRecord.bulk_insert(session, records)
+
+        assert inserted == 3
+        session.execute.assert_awaited_once()
+        stmt, params = session.execute.call_args.args
+        assert str(stmt).startswith("INSERT INTO cost_records")
+        assert params == records
+
+    @pytest.mark.unit
+    async def test_bulk_insert_accepts_slotted_rows(self):
+        """Test that bulk_insert accepts CostRecordRow instances."""
+        row = CostRecordRow(
+            cloud_provider_id=uuid.uuid4(),
+            billing_period_start=datetime(2025, 10, 1),
+            billing_period_end=datetime(2025, 10, 2),
+            cost_amount_micros=1_250_000,
+            service_name="EC2",
+            resource_type="Instance",
+            resource_identifier="i-1",
         )
-        saved_cost = result.scalar_one()
+        session = AsyncMock()
+
+        assert not hasattr(row, "__dict__")
+        assert await CostRecord.bulk_insert(session, [row]) == 1
+        params = session.execute.call_args.args[1]
+        assert params[0]["cost_amount_micros"] == 1_250_000
+        assert params[0]["currency"] == "USD"
+
+    @pytest.mark.unit
+    async def test_bulk_upsert_on_natural_key(self):
+        """Test that bulk_upsert resolves conflicts on the natural key constraint."""
+        from decimal import Decimal
+
+        from sqlalchemy.dialects import postgresql
+
+        session = AsyncMock()
+        record = {
+            "cloud_provider_id": uuid.uuid4(),
+            "service_name": "EC2",
+            "resource_type": "Instance",
+            "resource_identifier": "i-1",
+            "cost_amount_micros": to_micros(Decimal("1.25")),
+            "billing_period_start": datetime(2025, 10, 1),
+            "billing_period_end": datetime(2025, 10, 2),
+        }
+
+        assert await CostRecord.bulk_upsert(session, [record]) == 1
+
+        stmt = session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT unique_cost_record_natural_key DO UPDATE" in sql
+        assert "cost_amount_micros = excluded.cost_amount_micros" in sql
+
+    @pytest.mark.unit
+    def test_cost_amount_stored_as_micros(self):
+        """Test that the Decimal cost amount round-trips through integer micros."""
+        from decimal import Decimal
+
+        from sqlalchemy.dialects import postgresql
+
+        cost = CostRecord(cost_amount=Decimal("150.754321"))
+
+        assert cost.cost_amount_micros == 150_754_321
+        assert cost.cost_amount == Decimal("150.754321")
+        assert to_micros(0.1) == 100_000
+
+        sql = str(CostRecord.cost_amount.expression.compile(dialect=postgresql.dialect()))
+        assert "CAST(cost_records.cost_amount_micros AS NUMERIC)" in sql
+
+
+class TestCostBudgetModel:
+    """Test CostBudget model."""
+
+    @pytest.mark.unit
+    def test_thresholds_in_basis_points(self):
+        """Test that warning/critical thresholds are interpreted as basis points."""
+        from decimal import Decimal
+
+        budget = CostBudget(
+            name="Team budget",
+            budget_amount=Decimal("1000.00"),
+            current_spend=Decimal("850.00"),
+            warning_threshold=8000,
+            critical_threshold=10000,
+        )
+
+        assert budget.spend_percentage == Decimal("85")
+        assert budget.is_warning_threshold_exceeded() is True
+        assert budget.is_critical_threshold_exceeded() is False
+
+    @pytest.mark.unit
+    def test_thresholds_allow_large_overruns(self):
+        """Test that thresholds above 327.67% fit the column type."""
+        from decimal import Decimal
+
+        from sqlalchemy import Integer, SmallInteger
+
+        for name in ("warning_threshold", "critical_threshold"):
+            column_type = CostBudget.__table__.c[name].type
+            assert isinstance(column_type, Integer)
+            assert not isinstance(column_type, SmallInteger)
+
+        budget = CostBudget(
+            budget_amount=Decimal("100.00"),
+            current_spend=Decimal("450.00"),
+            critical_threshold=50000,
+        )
+        assert budget.is_critical_threshold_exceeded() is False
+
+    @pytest.mark.unit
+    def test_derived_values_reset_on_change(self):
+        """Test that memoized spend figures are recomputed after spend changes."""
+        from decimal import Decimal
+
+        budget = CostBudget(
+            name="Team budget",
+            budget_amount=Decimal("1000.00"),
+            current_spend=Decimal("250.00"),
+        )
+        assert budget.remaining_budget == Decimal("750.00")
+        assert budget.spend_percentage == Decimal("25")
+
+        budget.current_spend = Decimal("1200.00")
+
+        assert budget.remaining_budget == Decimal("0")
+        assert budget.spend_percentage == Decimal("120")
+
+
+class TestCostAlertModel:
+    """Test CostAlert model."""
+
+    @pytest.mark.unit
+    def test_resolve_uses_server_timestamp(self):
+        """Test that resolving an alert defers the timestamp to the database."""
+        alert = CostAlert(name="Spike", message="Cost spike detected")
+        user_id = uuid.uuid4()
+
+        alert.resolve(user_id)
+
+        assert alert.alert_status == AlertStatus.RESOLVED
+        assert alert.resolved_by == user_id
+        assert str(alert.resolved_at) == "now()"
+
+    @pytest.mark.unit
+    async def test_bulk_resolve_single_statement(self):
+        """Test that bulk_resolve issues one UPDATE for all alerts."""
+        session = AsyncMock()
+        session.execute.return_value = Mock(rowcount=3)
+        ids = [uuid.uuid4() for _ in range(3)]
+
+        updated = await CostAlert.bulk_resolve(session, ids, uuid.uuid4())
+
+        assert updated == 3
+        session.execute.assert_awaited_once()
+        assert str(session.execute.call_args.args[0]).startswith("UPDATE cost_alerts")
+
+    @pytest.mark.unit
+    async def test_bulk_resolve_no_ids(self):
+        """Test that bulk_resolve skips the database when there is nothing to do."""
+        session = AsyncMock()
+
+        assert await CostAlert.bulk_resolve(session, [], uuid.uuid4()) == 0
+        session.execute.assert_not_called()
+
+    @pytest.mark.unit
+    def test_active_alerts_partial_index(self):
+        """Test that the active-alerts index only covers open alerts."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex
+
+        index = next(i for i in CostAlert.__table__.indexes if i.name == "ix_cost_alerts_active")
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
 
-        assert saved_cost.cost_amount == Decimal("150.75")
-        assert saved_cost.currency == "USD"
-        assert saved_cost.service_name == "EC2"
+        assert "INCLUDE (budget_id, alert_type)" in ddl
+        assert "WHERE alert_status IN ('active', 'triggered')" in ddl